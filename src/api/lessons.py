@@ -24,6 +24,7 @@ from src.models.subject import Subject
 
 from src.api.dependencies import KBLoaderDep
 from src.database import get_async_db
+from src.exceptions import CircuitOpenError
 from src.models.audit_log import AuditLog
 from src.models.generated_lesson import GeneratedLesson
 from src.models.generation_request import GenerationRequest as GenerationRequestModel
@@ -223,7 +224,7 @@ async def generate_lesson(
     3. orchestrator.generate_lesson(topic, kb_loader)
     4. validator.validate(lesson_data, grade, subject)
     5. If validation fails -> status='failed', return 422
-    6. docx_generator.generate(lesson_data) -> bytes
+    6. docx_generator.generate_async(lesson_data) -> bytes
     7. Store GeneratedLesson in DB
     8. Update GenerationRequest status='completed'
     9. Write AuditLog entry
@@ -369,7 +370,7 @@ async def generate_lesson(
         # ----------------------------------------------------------------
         # Step 6: Generate DOCX
         # ----------------------------------------------------------------
-        docx_bytes = _docx_generator.generate(
+        docx_bytes = await _docx_generator.generate_async(
             lesson_data=lesson_data,
             grade=grade_code,
             subject=subject_code,
@@ -458,6 +459,10 @@ async def generate_lesson(
         except Exception:
             pass
 
+        if isinstance(exc, CircuitOpenError):
+            # Fail-fast rejection: the app handler answers 503 + Retry-After
+            raise
+
         raise HTTPException(
             status_code=500,
             detail={
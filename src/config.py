@@ -33,6 +33,45 @@ class Settings(BaseSettings):
         description="Anthropic API key for Claude lesson generation",
     )
 
+    claude_requests_per_minute: int = Field(
+        default=50,
+        description="Client-side cap on Claude requests started per minute (0 = unlimited)",
+    )
+
+    claude_tokens_per_minute: int = Field(
+        default=0,
+        description=(
+            "Client-side cap on estimated Claude tokens (prompt + max output) "
+            "started per minute (0 = unlimited)"
+        ),
+    )
+
+    claude_max_concurrency: int = Field(
+        default=8,
+        description="Maximum Claude requests in flight at once (0 = unlimited)",
+    )
+
+    claude_breaker_failure_threshold: int = Field(
+        default=5,
+        description=(
+            "Consecutive Claude connection/5xx failures that open the circuit "
+            "breaker, after which calls fail immediately"
+        ),
+    )
+
+    claude_breaker_reset_seconds: float = Field(
+        default=30.0,
+        description="Seconds the Claude circuit breaker stays open before a probe call",
+    )
+
+    lesson_cache_size: int = Field(
+        default=0,
+        description=(
+            "Generated lessons kept in memory and returned for an identical prompt "
+            "(0 = disabled, so every request asks Claude for a fresh lesson)"
+        ),
+    )
+
     # Knowledge Base
     kb_path: str = Field(
         default="kb_files",
@@ -65,6 +104,23 @@ class Settings(BaseSettings):
         ),
     )
 
+    kb_cache_dir: str = Field(
+        default="",
+        description=(
+            "Directory for the parsed-KB pickle cache, reused across restarts while "
+            "the KB files are unchanged. Empty disables the on-disk cache. Must not "
+            "be writable by untrusted users (cache files are unpickled on load)."
+        ),
+    )
+
+    kb_watch: bool = Field(
+        default=True,
+        description=(
+            "Reload the KB automatically when its files change on disk "
+            "(requires the optional watchfiles package)"
+        ),
+    )
+
     # Runtime
     log_level: str = Field(default="INFO", description="Python logging level")
     debug: bool = Field(default=False, description="Enable FastAPI debug mode")
@@ -43,6 +43,19 @@ class LessonGenerationError(Exception):
         self.attempt: int = attempt
 
 
+class CircuitOpenError(LessonGenerationError):
+    """Raised without calling Claude while the API circuit breaker is open.
+
+    Args:
+        message: Description of why the call was rejected.
+        retry_after: Seconds until the breaker lets a probe call through.
+    """
+
+    def __init__(self, message: str, retry_after: float = 0.0) -> None:
+        super().__init__(message)
+        self.retry_after: float = retry_after
+
+
 class ValidationError(Exception):
     """Raised when a generated lesson fails KB validation checks.
 
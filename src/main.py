@@ -12,8 +12,10 @@ Features:
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
+import math
 import time
 import uuid
 from contextlib import asynccontextmanager
@@ -25,6 +27,7 @@ from fastapi.responses import JSONResponse
 
 from src.config import get_settings
 from src.exceptions import (
+    CircuitOpenError,
     DatabaseConnectionError,
     KBLoadError,
     LessonGenerationError,
@@ -52,7 +55,8 @@ from src.api import kb as _kb_module  # noqa: E402
 from src.api import lessons as _lessons_module  # noqa: E402
 from src.api import topics as _topics_module  # noqa: E402
 from src.database import check_db_connection, dispose_engine  # noqa: E402
-from src.services.kb_loader import KBLoader  # noqa: E402
+from src.services.kb_loader import KBLoader, get_kb_loader  # noqa: E402
+from src.services.orchestrator import close_clients as close_claude_clients  # noqa: E402
 
 # Register all ORM models with the declarative base (required for metadata)
 import src.models  # noqa: F401, E402
@@ -61,6 +65,9 @@ import src.models  # noqa: F401, E402
 # Lifespan context manager
 # ---------------------------------------------------------------------------
 
+# Seconds to wait for the KB watcher to notice its stop event on shutdown
+_KB_WATCH_STOP_TIMEOUT = 5.0
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -69,17 +76,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Startup sequence:
     1. Load KB files from disk; raise if required files are absent.
     2. Store the loaded KBLoader on ``app.state.kb_loader`` for DI.
-    3. Probe DB connectivity and log the result (non-fatal at startup).
+    3. Start watching the KB directory for edits (when ``kb_watch`` is on).
+    4. Probe DB connectivity and log the result (non-fatal at startup).
 
     Shutdown:
-    1. Dispose the SQLAlchemy connection pool gracefully.
+    1. Stop the KB watcher.
+    2. Close the shared Claude API clients.
+    3. Dispose the SQLAlchemy connection pool gracefully.
     """
     # --- Startup -----------------------------------------------------------
     logger.info(
         "KitmeK Lesson Generation API — starting up (v%s)", _settings.app_version
     )
 
-    kb_loader = KBLoader(kb_path=_settings.kb_path)
+    kb_loader = get_kb_loader(_settings.kb_path)
     try:
         kb_data = kb_loader.load()
         app.state.kb_loader = kb_loader
@@ -100,6 +110,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app.state.kb_loader = None
         raise RuntimeError(f"Cannot start: KB load error: {exc}") from exc
 
+    kb_watch_stop = asyncio.Event()
+    kb_watch_task = (
+        asyncio.create_task(kb_loader.watch(kb_watch_stop)) if _settings.kb_watch else None
+    )
+
     db_health = await check_db_connection()
     if db_health["status"] == "ok":
         logger.info("Database: OK")
@@ -111,6 +126,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # --- Shutdown ----------------------------------------------------------
     logger.info("KitmeK API — shutting down")
+    if kb_watch_task is not None:
+        # Stop via the event rather than cancelling: a cancelled watcher leaves
+        # its native watch thread running, which aborts the interpreter at exit
+        kb_watch_stop.set()
+        # asyncio.wait (unlike wait_for) never cancels the task on timeout
+        done, _ = await asyncio.wait({kb_watch_task}, timeout=_KB_WATCH_STOP_TIMEOUT)
+        if kb_watch_task not in done:
+            logger.warning("KB watcher did not stop within %.0f s", _KB_WATCH_STOP_TIMEOUT)
+        else:
+            try:
+                kb_watch_task.result()
+            except Exception as exc:
+                logger.warning("KB watcher failed: %s", exc)
+    try:
+        await close_claude_clients()
+    except Exception as exc:
+        logger.warning("Error closing Claude API clients: %s", exc)
     try:
         await dispose_engine()
     except Exception as exc:
@@ -248,6 +280,22 @@ async def topic_not_found_handler(
     )
 
 
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError) -> JSONResponse:
+    """503 with ``Retry-After`` while the Claude circuit breaker is open."""
+    retry_after = max(1, math.ceil(exc.retry_after))
+    logger.warning("CircuitOpenError: %s", exc)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "error": "claude_unavailable",
+            "message": str(exc),
+            "retry_after": retry_after,
+        },
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
 @app.exception_handler(LessonGenerationError)
 async def lesson_generation_error_handler(
     request: Request, exc: LessonGenerationError
@@ -0,0 +1,118 @@
+"""Circuit breaker for Claude API calls.
+
+During a sustained provider outage every lesson request would otherwise
+spend its full retry budget before failing.  :class:`CircuitBreaker` opens
+after ``failure_threshold`` consecutive upstream failures and then rejects
+calls immediately with :class:`~src.exceptions.CircuitOpenError` until
+``reset_timeout`` has passed, when a single probe call is let through.
+
+States: ``closed`` (calls pass) → ``open`` (calls rejected) → ``half_open``
+(one probe in flight) → ``closed`` on success, back to ``open`` on failure.
+
+Usage::
+
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30.0)
+    message = await breaker.call(lambda: client.messages.create(...))
+"""
+
+import logging
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from src.exceptions import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitBreaker:
+    """Process-wide closed/open/half-open breaker.
+
+    Args:
+        failure_threshold: Consecutive counted failures that open the circuit.
+        reset_timeout: Seconds the circuit stays open before a probe is allowed.
+        is_failure: Decides which exceptions count as upstream failures;
+            anything else (e.g. an unparseable response) proves the upstream
+            answered and counts as a success.  Defaults to every exception.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        is_failure: Callable[[Exception], bool] | None = None,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._is_failure = is_failure or (lambda exc: True)
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current state: ``"closed"``, ``"open"`` or ``"half_open"``."""
+        if self._opened_at is None:
+            return "closed"
+        if self._probe_in_flight:
+            return "half_open"
+        return "open"
+
+    async def call(self, coro_factory: Callable[[], Awaitable[T]]) -> T:
+        """Run ``coro_factory()`` unless the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or a probe is already
+                in flight) — the factory is not called.
+        """
+        probe = self._admit()
+        try:
+            result = await coro_factory()
+        except Exception as exc:
+            if self._is_failure(exc):
+                self._record_failure(probe)
+            else:
+                self._record_success(probe)
+            raise
+        except BaseException:
+            # Cancelled: no verdict on the upstream, let the next call probe
+            if probe:
+                self._probe_in_flight = False
+            raise
+        self._record_success(probe)
+        return result
+
+    def _admit(self) -> bool:
+        """Let a call through or raise; returns ``True`` for a half-open probe."""
+        if self._opened_at is None:
+            return False
+        remaining = self._opened_at + self.reset_timeout - time.monotonic()
+        if remaining > 0 or self._probe_in_flight:
+            raise CircuitOpenError(
+                "Claude API circuit is open after repeated upstream failures; "
+                f"retry in {max(remaining, 0.0):.0f} s",
+                retry_after=max(remaining, 0.0),
+            )
+        self._probe_in_flight = True
+        return True
+
+    def _record_success(self, probe: bool) -> None:
+        if probe:
+            logger.info("Claude API probe succeeded; circuit closed")
+        self._failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    def _record_failure(self, probe: bool) -> None:
+        self._failures += 1
+        if probe or self._failures >= self.failure_threshold:
+            if self._opened_at is None or probe:
+                logger.warning(
+                    "Claude API circuit opened after %d consecutive failures; "
+                    "rejecting calls for %.0f s",
+                    self._failures,
+                    self.reset_timeout,
+                )
+            self._opened_at = time.monotonic()
+            self._probe_in_flight = False
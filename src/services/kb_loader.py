@@ -1,42 +1,118 @@
 """Knowledge Base loader and parser for KitmeK lesson generation.
 
-Reads all Markdown files from the configured ``kb_path``, parses structured
+Reads the expected Markdown files from the configured ``kb_path``, parses structured
 data (language constraints, interaction types, Bloom's distributions) using
-only stdlib ``re``, and caches results in memory after the first load.
+only stdlib ``re``, and caches results in memory after the first load.  When
+``Settings.kb_cache_dir`` is set, the parsed data is also pickled there and
+reused by later processes for as long as the ``.md`` files are unchanged.
 
 Usage::
 
-    from src.services.kb_loader import KBLoader
+    from src.services.kb_loader import get_kb_loader
 
-    loader = KBLoader()
+    loader = get_kb_loader()                 # process-wide, one per kb_path
     loader.load()                            # raises KBLoadError if required files missing
     ceiling = loader.get_language_ceiling("3")
     dist = loader.get_bloom_distribution("3")
     interactions = loader.get_allowed_interactions("3")
 """
 
+import asyncio
+import dataclasses
+import functools
 import hashlib
 import logging
+import os
+import pickle
 import re
+import sys
+import tempfile
+import threading
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator
 
 from src.config import get_settings
 from src.exceptions import KBLoadError
 
+try:  # optional: shipped with uvicorn[standard]; without it KB edits need reload()
+    import watchfiles
+except ImportError:  # pragma: no cover - depends on the install
+    watchfiles = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Canonical (interned) grade codes and Bloom's level names.  Parsed keys are
+# mapped onto these so every KBData shares one string object per key.
+_GRADE_CODES: dict[str, str] = {g: sys.intern(g) for g in ("K", "1", "2", "3", "4", "5")}
+_BLOOM_LEVELS: tuple[str, ...] = ("L1", "L2", "L3", "L4", "L5")
+
+# Upper bound on concurrent file reads in ``KBLoader._read_files``
+_MAX_READ_WORKERS = 16
+
+# Bump when KBData's shape or the parsers change so stale disk caches are ignored
+_DISK_CACHE_FORMAT = 4
+
+# ---------------------------------------------------------------------------
+# Compiled patterns — built once at import rather than on every parse / lookup
+# ---------------------------------------------------------------------------
+
+_GRADE_SECTION_RE = re.compile(r"^## Grade (\w+)", re.MULTILINE)
+# The three per-grade language fields, matched in a single pass over each
+# section body.  Range fields capture the upper bound of "X–Y" (en-dash U+2013
+# or ASCII hyphen); the connectors branch captures the rest of its line.
+_LANGUAGE_FIELDS_RE = re.compile(
+    r"Maximum sentence length:\s*\d+[\u2013\-]\s*(?P<sentence>\d+)\s*words"
+    r"|New words per lesson:\s*\d+[\u2013\-]\s*(?P<vocab>\d+)"
+    r"|Allowed connectors:\s*(?P<connectors>.+?)$",
+    re.MULTILINE | re.IGNORECASE,
+)
+# Connectors implied by "Allowed connectors: all common conjunctions ..."
+_ALL_CONNECTORS: tuple[str, ...] = (
+    "and", "but", "or", "so", "because", "when", "if", "although", "however", "therefore",
+)
+_ALL_WORD_RE = re.compile(r"\ball\b", re.IGNORECASE)
+_QUOTED_CONNECTOR_RE = re.compile(
+    r'"(and|but|or|so|because|when|if|although),?"', re.IGNORECASE
+)
+_SUBSECTION_RE = re.compile(r"\n###")
+_NEXT_HEADING_RE = re.compile(r"\n#{1,3}\s+")
+_HEADING_TEXT_RE = re.compile(r"^#{1,3}\s+(.+?)\s*$", re.MULTILINE)
+
+
+def _iter_grade_sections(content: str) -> Iterator[tuple[str, str]]:
+    """Yield ``(grade_code, body)`` for each ``## Grade <code>`` section of *content*.
+
+    Bodies are sliced between consecutive heading matches, so no list of
+    intermediate segments is built (unlike ``re.split``).
+    """
+    matches = list(_GRADE_SECTION_RE.finditer(content))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        yield sys.intern(match.group(1).strip()), content[match.end() : end]
+
+
+@functools.lru_cache(maxsize=256)
+def _concept_heading_re(concept: str) -> re.Pattern[str]:
+    """Return the (memoized) heading pattern used by ``KBLoader.get_definition``."""
+    return re.compile(rf"(?im)^#{{1,3}}\s+{re.escape(concept)}\b")
+
 
 # ---------------------------------------------------------------------------
 # Data containers
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LanguageCeiling:
     """Language complexity constraints for a specific grade.
 
+    Immutable: instances are shared by every caller of
+    :meth:`KBLoader.get_language_ceiling`.
+
     Attributes:
         grade: Grade code, e.g. ``"3"``.
         max_sentence_length: Upper bound on words per sentence.
@@ -52,7 +128,11 @@ class LanguageCeiling:
     can_use_because: bool = False
 
 
-@dataclass
+# Fallback limits for a grade section that omits a field
+_DEFAULT_CEILING = LanguageCeiling(grade="", max_sentence_length=18, max_new_vocab=10)
+
+
+@dataclass(slots=True)
 class KBData:
     """Container for all parsed knowledge base data.
 
@@ -62,8 +142,12 @@ class KBData:
         files_loaded: Sorted list of filenames successfully loaded.
         raw_content: Mapping of filename → raw UTF-8 markdown text.
         language_ceilings: Grade → ``LanguageCeiling`` mapping.
-        bloom_distributions: Grade → ``{"L1": n, "L2": n, ...}`` mapping.
-        allowed_interactions: Grade → list of interaction type names.
+        bloom_distributions: Grade → read-only ``{"L1": n, "L2": n, ...}`` mapping.
+        allowed_interactions: Grade → tuple of interaction type names.
+        definitions_index: Lower-cased heading text from
+            ``definitions_and_examples.md`` → resolved definition snippet
+            (``None`` where the lookup yields nothing).  Built lazily by the
+            first :meth:`KBLoader.get_definition` call; ``None`` until then.
     """
 
     version: str
@@ -71,8 +155,9 @@ class KBData:
     files_loaded: list[str]
     raw_content: dict[str, str]
     language_ceilings: dict[str, LanguageCeiling]
-    bloom_distributions: dict[str, dict[str, int]]
-    allowed_interactions: dict[str, list[str]]
+    bloom_distributions: dict[str, Mapping[str, int]]
+    allowed_interactions: dict[str, tuple[str, ...]]
+    definitions_index: dict[str, str | None] | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -96,6 +181,8 @@ class KBLoader:
         settings = get_settings()
         self.kb_path: Path = Path(kb_path or settings.kb_path)
         self._cache: KBData | None = None
+        # Serialises parsing so concurrent first calls don't each parse the KB
+        self._lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Public API
@@ -104,46 +191,39 @@ class KBLoader:
     def load(self) -> KBData:
         """Load and parse all KB files, caching results in memory.
 
+        Thread-safe: the cached fast path takes no lock, and concurrent
+        first calls parse the KB only once.
+
         Returns:
             Fully parsed :class:`KBData` object.
 
         Raises:
             KBLoadError: If required files are missing from ``kb_path``.
         """
-        if self._cache is not None:
+        cached = self._cache
+        if cached is not None:
+            return cached
+        with self._lock:
+            if self._cache is None:
+                self._cache = self._build()
             return self._cache
 
-        settings = get_settings()
-        self._validate_required_files(settings.kb_required_files)
+    async def aload(self) -> KBData:
+        """Async :meth:`load`: returns cached data directly, else parses in a thread.
 
-        raw_content = self._read_files(settings.kb_expected_files)
-        checksum = self._compute_checksum(raw_content)
+        Keeps a cold or reloading KB from blocking the event loop while files
+        are read and parsed.
 
-        language_ceilings = self._parse_language_guidelines(
-            raw_content.get("language_guidelines.md", "")
-        )
-        bloom_distributions = self._parse_bloom_distributions(
-            raw_content.get("NCERT_Pedagogical_Style_Knowledge.md", "")
-        )
-        allowed_interactions = self._parse_allowed_interactions(
-            raw_content.get("digital_interactions.md", "")
-        )
+        Returns:
+            Fully parsed :class:`KBData` object.
 
-        self._cache = KBData(
-            version="1.0",
-            checksum=checksum,
-            files_loaded=sorted(raw_content.keys()),
-            raw_content=raw_content,
-            language_ceilings=language_ceilings,
-            bloom_distributions=bloom_distributions,
-            allowed_interactions=allowed_interactions,
-        )
-        logger.info(
-            "KB loaded: %d files, checksum=%s",
-            len(raw_content),
-            checksum[:16],
-        )
-        return self._cache
+        Raises:
+            KBLoadError: If required files are missing from ``kb_path``.
+        """
+        cached = self._cache
+        if cached is not None:
+            return cached
+        return await asyncio.to_thread(self.load)
 
     def reload(self) -> KBData:
         """Invalidate the in-memory cache and reload all KB files from disk.
@@ -154,8 +234,42 @@ class KBLoader:
         Raises:
             KBLoadError: If required files are missing.
         """
-        self._cache = None
-        return self.load()
+        with self._lock:
+            self._cache = None
+            self._cache = self._build()
+            return self._cache
+
+    async def watch(self, stop_event: asyncio.Event | None = None) -> None:
+        """Re-read the KB whenever one of its ``.md`` files changes on disk.
+
+        Uses ``watchfiles`` (inotify / FSEvents) so there is no per-request
+        freshness check.  Runs until cancelled or *stop_event* is set; returns
+        immediately if ``watchfiles`` is not installed.  A failed re-read is
+        logged and the previously loaded data stays active; if the watcher
+        itself fails (e.g. the OS watch limit is reached) that is logged and
+        the method returns, leaving ``POST /kb/reload`` as the way to refresh.
+        """
+        if watchfiles is None:
+            logger.info("watchfiles not installed; KB changes require POST /kb/reload")
+            return
+        logger.info("Watching %s for KB changes", self.kb_path)
+        try:
+            async for changes in watchfiles.awatch(
+                self.kb_path,
+                watch_filter=lambda _change, path: path.endswith(".md"),
+                stop_event=stop_event,
+            ):
+                logger.info("KB files changed on disk (%d events); reloading", len(changes))
+                try:
+                    await asyncio.to_thread(self._refresh)
+                except Exception as exc:
+                    logger.error(
+                        "KB reload after file change failed; keeping previous data: %s", exc
+                    )
+        except Exception as exc:
+            logger.error(
+                "KB file watcher stopped; KB changes require POST /kb/reload: %s", exc
+            )
 
     def get_language_ceiling(self, grade: str) -> LanguageCeiling:
         """Return the language complexity ceiling for a grade.
@@ -174,30 +288,31 @@ class KBLoader:
             grade = "5"
         return kb.language_ceilings[grade]
 
-    def get_bloom_distribution(self, grade: str) -> dict[str, int]:
+    def get_bloom_distribution(self, grade: str) -> Mapping[str, int]:
         """Return the required Bloom's taxonomy distribution for a grade's quiz.
 
         Args:
             grade: Grade code.
 
         Returns:
-            dict mapping Bloom's level (``"L1"``–``"L5"``) to question count.
+            Read-only mapping of Bloom's level (``"L1"``–``"L5"``) to question
+            count, shared across calls (copy it before mutating).
         """
         kb = self.load()
         if grade not in kb.bloom_distributions:
             logger.warning("Grade %r not in bloom_distributions; using Grade 3", grade)
             grade = "3"
-        return dict(kb.bloom_distributions[grade])
+        return kb.bloom_distributions[grade]
 
-    def get_allowed_interactions(self, grade: str) -> list[str]:
+    def get_allowed_interactions(self, grade: str) -> Sequence[str]:
         """Return the allowed interaction type names for a grade.
 
         Args:
             grade: Grade code.
 
         Returns:
-            List of canonical interaction type names (from the enum in
-            ``digital_interactions.md``).
+            Tuple of canonical interaction type names (from the enum in
+            ``digital_interactions.md``), shared across calls.
         """
         kb = self.load()
         if grade not in kb.allowed_interactions:
@@ -205,7 +320,7 @@ class KBLoader:
                 "Grade %r not in allowed_interactions; using Grade 5 set", grade
             )
             grade = "5"
-        return list(kb.allowed_interactions[grade])
+        return kb.allowed_interactions[grade]
 
     def get_definition(self, concept: str, grade: str) -> str | None:
         """Return the authoritative KB definition for a concept, if available.
@@ -221,18 +336,17 @@ class KBLoader:
         content = kb.raw_content.get("definitions_and_examples.md", "")
         if not content:
             return None
-        pattern = rf"(?im)^#{{1,3}}\s+{re.escape(concept)}\b"
-        match = re.search(pattern, content)
-        if not match:
-            return None
-        start = match.end()
-        next_heading = re.search(r"\n#{1,3}\s+", content[start:])
-        snippet = (
-            content[start : start + next_heading.start()]
-            if next_heading
-            else content[start:]
-        )
-        return snippet.strip() or None
+        index = kb.definitions_index
+        if index is None:
+            # Only definition lookups need the index, so it is built on first use
+            with self._lock:
+                if kb.definitions_index is None:
+                    kb.definitions_index = self._parse_definitions(content)
+                index = kb.definitions_index
+        key = concept.lower()
+        if key in index:
+            return index[key]
+        return self._find_definition(content, concept)
 
     def get_full_content(self, filename: str) -> str:
         """Return the raw markdown content of a specific KB file.
@@ -269,64 +383,226 @@ class KBLoader:
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _validate_required_files(self, required: list[str]) -> None:
+    def _refresh(self) -> None:
+        """Rebuild the KB and swap it in only once the new data parsed cleanly."""
+        with self._lock:
+            self._cache = self._build()
+
+    def _build(self) -> KBData:
+        """Read and parse the KB, or restore it from the disk cache; caller holds ``_lock``."""
+        settings = get_settings()
+        entries = self._scan_kb_dir(
+            {*settings.kb_required_files, *settings.kb_expected_files}
+        )
+        self._validate_required_files(settings.kb_required_files, entries)
+
+        cache_file = self._disk_cache_file(settings.kb_cache_dir, entries)
+        if cache_file is not None:
+            cached = self._read_disk_cache(cache_file)
+            if cached is not None:
+                logger.info(
+                    "KB loaded from disk cache: %d files, checksum=%s",
+                    len(cached.files_loaded),
+                    cached.checksum[:16],
+                )
+                return cached
+
+        raw_content, checksum = self._read_files(settings.kb_expected_files, entries)
+
+        language_ceilings = self._parse_language_guidelines(
+            raw_content.get("language_guidelines.md", "")
+        )
+        bloom_distributions = self._parse_bloom_distributions(
+            raw_content.get("NCERT_Pedagogical_Style_Knowledge.md", "")
+        )
+        allowed_interactions = self._parse_allowed_interactions(
+            raw_content.get("digital_interactions.md", "")
+        )
+
+        kb = KBData(
+            version="1.0",
+            checksum=checksum,
+            files_loaded=sorted(raw_content.keys()),
+            raw_content=raw_content,
+            language_ceilings=language_ceilings,
+            bloom_distributions=bloom_distributions,
+            allowed_interactions=allowed_interactions,
+        )
+        logger.info(
+            "KB loaded: %d files, checksum=%s",
+            len(raw_content),
+            checksum[:16],
+        )
+        if cache_file is not None:
+            self._write_disk_cache(cache_file, kb)
+        return kb
+
+    def _scan_kb_dir(self, wanted: set[str]) -> dict[str, os.DirEntry[str]]:
+        """List ``kb_path`` once and return the entries for the *wanted* files.
+
+        This single ``os.scandir`` pass replaces a per-file existence check;
+        the entries then drive the disk-cache fingerprint and the reads.  A
+        ``kb_path`` that is missing or not a directory yields no entries
+        (every required file is missing).
+        """
+        try:
+            with os.scandir(self.kb_path) as it:
+                return {e.name: e for e in it if e.name in wanted and e.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+
+    def _validate_required_files(
+        self, required: list[str], entries: dict[str, os.DirEntry[str]]
+    ) -> None:
         """Raise :exc:`KBLoadError` if any required file is absent."""
-        missing = [f for f in required if not (self.kb_path / f).exists()]
+        missing = [f for f in required if f not in entries]
         if missing:
             raise KBLoadError(
                 f"Required KB files missing from {self.kb_path}: {missing}",
                 missing_files=missing,
             )
 
-    def _read_files(self, expected: list[str]) -> dict[str, str]:
-        """Read all .md files from kb_path.
+    def _read_files(
+        self, expected: list[str], entries: dict[str, os.DirEntry[str]]
+    ) -> tuple[dict[str, str], str]:
+        """Read the expected .md files from kb_path and checksum them.
 
-        First reads every .md file found by glob; then warns about expected
-        files that were not found (optional files).
+        Reads every expected file present in *entries*, concurrently on a
+        small thread pool, and warns about expected files that were not found
+        (optional files).  Other ``.md`` files in ``kb_path`` are ignored.
+        The SHA-256 checksum is fed the raw file bytes as they are collected
+        (in sorted name order), so decoded text is never re-encoded just to
+        be hashed.
 
         Args:
             expected: Full expected filenames list (required + optional).
+            entries: Directory entries from :meth:`_scan_kb_dir`.
 
         Returns:
-            Mapping of filename → UTF-8 content for all successfully read files.
+            Tuple of (filename → UTF-8 content for all successfully read files,
+            SHA-256 hex digest of those files).
         """
         result: dict[str, str] = {}
-        for md_file in sorted(self.kb_path.glob("*.md")):
-            try:
-                result[md_file.name] = md_file.read_text(encoding="utf-8")
-                logger.debug(
-                    "Loaded KB file: %s (%d bytes)",
-                    md_file.name,
-                    len(result[md_file.name]),
-                )
-            except OSError as exc:
-                logger.warning("Could not read KB file %s: %s", md_file, exc)
-
-        for fname in expected:
-            if fname not in result:
-                logger.warning(
-                    "Optional KB file not found (will be skipped): %s", fname
-                )
+        h = hashlib.sha256()
+        for fname in sorted(set(expected) - entries.keys()):
+            logger.warning("Optional KB file not found (will be skipped): %s", fname)
+        names = sorted(set(expected) & entries.keys())
+        if names:
+            # Reads release the GIL, so a small pool overlaps per-file latency
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_READ_WORKERS, len(names))
+            ) as executor:
+                paths = [Path(entries[fname].path) for fname in names]
+                for fname, data in zip(names, executor.map(self._read_file, paths)):
+                    if data is None:
+                        continue
+                    h.update(fname.encode("utf-8"))
+                    h.update(data)
+                    result[fname] = self._decode_markdown(data)
+
+        return result, h.hexdigest()
+
+    def _disk_cache_file(
+        self, cache_dir: str, entries: dict[str, os.DirEntry[str]]
+    ) -> Path | None:
+        """Return the pickle path for the current KB state, or ``None`` if disabled.
+
+        The name encodes a fingerprint of each scanned file's name, mtime and
+        size (one ``stat`` each, no reads), so any edit — including a file
+        appearing or disappearing — selects a new cache file.
+        """
+        if not cache_dir:
+            return None
+        kb_dir = str(self.kb_path.resolve())
+        h = hashlib.sha256(f"{_DISK_CACHE_FORMAT}\0{kb_dir}".encode("utf-8"))
+        prefix = f"kbcache-{h.hexdigest()[:12]}-"
+        try:
+            for fname in sorted(entries):
+                st = entries[fname].stat()
+                h.update(f"\0{fname}\0{st.st_mtime_ns}\0{st.st_size}".encode("utf-8"))
+        except OSError as exc:
+            logger.warning("Could not stat KB files for disk cache: %s", exc)
+            return None
+        return Path(cache_dir) / f"{prefix}{h.hexdigest()[:16]}.pkl"
+
+    def _read_disk_cache(self, cache_file: Path) -> KBData | None:
+        """Return the pickled :class:`KBData` at *cache_file*, or ``None`` on any miss."""
+        try:
+            with cache_file.open("rb") as fh:
+                cached = pickle.load(fh)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # corrupt or incompatible cache — rebuild it
+            logger.warning("Ignoring unreadable KB disk cache %s: %s", cache_file, exc)
+            return None
+        if not isinstance(cached, KBData):
+            return None
+        # Distributions are pickled as plain dicts (see _write_disk_cache)
+        cached.bloom_distributions = {
+            g: MappingProxyType(d) for g, d in cached.bloom_distributions.items()
+        }
+        return cached
 
-        return result
+    def _write_disk_cache(self, cache_file: Path, kb: KBData) -> None:
+        """Atomically write *kb* to *cache_file* and drop stale caches for this KB.
 
-    def _compute_checksum(self, raw_content: dict[str, str]) -> str:
-        """Return SHA-256 hex digest of all file contents in sorted name order."""
-        h = hashlib.sha256()
-        for name in sorted(raw_content.keys()):
-            h.update(name.encode("utf-8"))
-            h.update(raw_content[name].encode("utf-8"))
-        return h.hexdigest()
+        Failures are logged and otherwise ignored — the disk cache is an
+        optimisation only.
+        """
+        prefix = cache_file.name.rsplit("-", 1)[0]
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            try:
+                # MappingProxyType cannot be pickled; store the plain dicts
+                picklable = dataclasses.replace(
+                    kb,
+                    bloom_distributions={
+                        g: dict(d) for g, d in kb.bloom_distributions.items()
+                    },
+                )
+                with os.fdopen(fd, "wb") as fh:
+                    pickle.dump(picklable, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, cache_file)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            for stale in cache_file.parent.glob(f"{prefix}-*.pkl"):
+                if stale != cache_file:
+                    stale.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.warning("Could not write KB disk cache %s: %s", cache_file, exc)
+
+    @staticmethod
+    def _read_file(md_file: Path) -> bytes | None:
+        """Read one KB file, returning ``None`` (and logging) if it cannot be read."""
+        try:
+            # read_bytes() skips the TextIOWrapper/BufferedReader setup of read_text()
+            data = md_file.read_bytes()
+        except OSError as exc:
+            logger.warning("Could not read KB file %s: %s", md_file, exc)
+            return None
+        logger.debug("Loaded KB file: %s (%d bytes)", md_file.name, len(data))
+        return data
+
+    @staticmethod
+    def _decode_markdown(data: bytes) -> str:
+        """Decode KB file bytes as UTF-8 with ``read_text()``-style newline handling."""
+        content = data.decode("utf-8")
+        if "\r" in content:
+            # Keep read_text()'s universal-newline behaviour for Windows-edited files
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
 
     # ------------------------------------------------------------------
-    # Parsers — stdlib regex only
+    # Parsers — stdlib regex only (patterns compiled at module level)
     # ------------------------------------------------------------------
 
     def _parse_language_guidelines(self, content: str) -> dict[str, LanguageCeiling]:
         """Parse ``language_guidelines.md`` into per-grade ``LanguageCeiling`` objects.
 
         Splits the document on level-2 headings of the form ``## Grade <code>``.
-        Within each grade section extracts:
+        Within each grade section extracts, in a single regex pass:
         - Upper bound of ``Maximum sentence length: X–Y words``
         - Upper bound of ``New words per lesson: X–Y``
         - Connectors quoted in the text (``"and"``, ``"because"``, etc.)
@@ -341,62 +617,46 @@ class KBLoader:
         if not content:
             return ceilings
 
-        section_re = re.compile(r"^## Grade (\w+)", re.MULTILINE)
-        sections = section_re.split(content)
-        # sections[0] = preamble; then pairs: grade_code, section_body
-        it = iter(sections[1:])
-        for grade_code, body in zip(it, it):
-            grade_code = grade_code.strip()
-
-            # Maximum sentence length (upper bound of range)
-            # Supports both en-dash (–, U+2013) and ASCII hyphen
-            sent_match = re.search(
-                r"Maximum sentence length:\s*\d+[\u2013\-]\s*(\d+)\s*words",
-                body,
-                re.IGNORECASE,
-            )
-            max_sentence = int(sent_match.group(1)) if sent_match else 18
-
-            # New words per lesson (upper bound of range)
-            vocab_match = re.search(
-                r"New words per lesson:\s*\d+[\u2013\-]\s*(\d+)",
-                body,
-                re.IGNORECASE,
+        for grade_code, body in _iter_grade_sections(content):
+            # One scan collects the first occurrence of each field
+            fields: dict[str, str] = {}
+            for match in _LANGUAGE_FIELDS_RE.finditer(body):
+                name = match.lastgroup
+                if name is not None and name not in fields:
+                    fields[name] = match.group(name)
+                    if len(fields) == 3:
+                        break
+
+            # Maximum sentence length / new words per lesson (upper bounds)
+            sentence = fields.get("sentence")
+            vocab = fields.get("vocab")
+            max_sentence = (
+                int(sentence) if sentence else _DEFAULT_CEILING.max_sentence_length
             )
-            max_vocab = int(vocab_match.group(1)) if vocab_match else 10
+            max_vocab = int(vocab) if vocab else _DEFAULT_CEILING.max_new_vocab
 
-            # Connectors: find the specific "Allowed connectors:" line to avoid
+            # Connectors: use only the specific "Allowed connectors:" line to avoid
             # picking up connectors mentioned in negative context (e.g. "no 'because'")
-            conn_match = re.search(
-                r"Allowed connectors:\s*(.+?)$", body, re.MULTILINE | re.IGNORECASE
-            )
-            if conn_match:
-                conn_line = conn_match.group(1)
-                # If the line says "all common conjunctions", expand to full list
-                if re.search(r"\ball\b", conn_line, re.IGNORECASE):
-                    connectors: list[str] = [
-                        "and",
-                        "but",
-                        "or",
-                        "so",
-                        "because",
-                        "when",
-                        "if",
-                        "although",
-                        "however",
-                        "therefore",
-                    ]
-                else:
-                    connectors = re.findall(
-                        r'"(and|but|or|so|because|when|if|although),?"',
-                        conn_line,
-                        re.IGNORECASE,
-                    )
+            conn_line = fields.get("connectors")
+            found: Iterable[str]
+            if conn_line is None:
+                found = ()
+            elif _ALL_WORD_RE.search(conn_line):
+                # The line says "all common conjunctions": expand to the full list
+                found = _ALL_CONNECTORS
             else:
-                connectors = []
-            connectors = list(dict.fromkeys(c.lower() for c in connectors))
+                found = _QUOTED_CONNECTOR_RE.findall(conn_line)
 
-            can_because = "because" in connectors
+            # Dedupe in first-seen order; the set doubles as the "because" check
+            connectors: list[str] = []
+            seen: set[str] = set()
+            for conn in found:
+                conn = conn.lower()
+                if conn not in seen:
+                    seen.add(conn)
+                    connectors.append(conn)
+
+            can_because = "because" in seen
 
             ceilings[grade_code] = LanguageCeiling(
                 grade=grade_code,
@@ -408,7 +668,43 @@ class KBLoader:
 
         return ceilings
 
-    def _parse_bloom_distributions(self, content: str) -> dict[str, dict[str, int]]:
+    def _parse_definitions(self, content: str) -> dict[str, str | None]:
+        """Pre-resolve :meth:`get_definition` for each ``definitions_and_examples.md`` heading.
+
+        One scan collects the level 1–3 heading texts; each is resolved with
+        the same lookup ``get_definition`` falls back to, so indexed and
+        unindexed concepts give identical results (including the first-match
+        and prefix behaviour of the heading pattern).
+
+        Args:
+            content: Raw markdown text.
+
+        Returns:
+            Mapping of lower-cased heading text to definition snippet.
+        """
+        index: dict[str, str | None] = {}
+        for match in _HEADING_TEXT_RE.finditer(content):
+            key = match.group(1).lower()
+            if key not in index:
+                index[key] = self._find_definition(content, key)
+        return index
+
+    @staticmethod
+    def _find_definition(content: str, concept: str) -> str | None:
+        """Return the text after the first heading starting with *concept*, up to the next one."""
+        match = _concept_heading_re(concept).search(content)
+        if not match:
+            return None
+        start = match.end()
+        next_heading = _NEXT_HEADING_RE.search(content[start:])
+        snippet = (
+            content[start : start + next_heading.start()]
+            if next_heading
+            else content[start:]
+        )
+        return snippet.strip() or None
+
+    def _parse_bloom_distributions(self, content: str) -> dict[str, Mapping[str, int]]:
         """Parse the Bloom's distribution table from NCERT_Pedagogical_Style_Knowledge.md.
 
         Looks for markdown table rows of the form::
@@ -417,32 +713,32 @@ class KBLoader:
             | 3 | 2 | 3 | 3 | 1 | 1 | 10 |
 
         Columns are interpreted as Grade | L1 | L2 | L3 | L4 | L5 | Total.
+        Rows are split on ``|`` with plain string operations; a row qualifies
+        when its first cell is a grade code followed by five integer cells.
 
         Args:
             content: Raw markdown text.
 
         Returns:
-            Mapping of grade code to Bloom's level counts.
+            Mapping of grade code to read-only Bloom's level counts.
         """
-        distributions: dict[str, dict[str, int]] = {}
+        distributions: dict[str, Mapping[str, int]] = {}
         if not content:
             return distributions
 
-        row_re = re.compile(
-            r"\|\s*([K1-5])\s*\|\s*(\d+)\s*\|\s*(\d+)\s*\|\s*(\d+)\s*\|\s*(\d+)\s*\|\s*(\d+)\s*\|"
-        )
-        for match in row_re.finditer(content):
-            grade = match.group(1)
-            distributions[grade] = {
-                "L1": int(match.group(2)),
-                "L2": int(match.group(3)),
-                "L3": int(match.group(4)),
-                "L4": int(match.group(5)),
-                "L5": int(match.group(6)),
-            }
+        for line in content.splitlines():
+            line = line.strip()
+            if not line.startswith("|"):
+                continue
+            cells = [c.strip() for c in line.strip("|").split("|")]
+            grade = _GRADE_CODES.get(cells[0]) if len(cells) >= 6 else None
+            if grade is not None and all(c.isdecimal() for c in cells[1:6]):
+                distributions[grade] = MappingProxyType(
+                    dict(zip(_BLOOM_LEVELS, map(int, cells[1:6])))
+                )
         return distributions
 
-    def _parse_allowed_interactions(self, content: str) -> dict[str, list[str]]:
+    def _parse_allowed_interactions(self, content: str) -> dict[str, tuple[str, ...]]:
         """Parse the allowed interaction types per grade from ``digital_interactions.md``.
 
         Splits on level-2 headings ``## Grade <code>``, then within each section
@@ -453,26 +749,20 @@ class KBLoader:
             content: Raw markdown text.
 
         Returns:
-            Mapping of grade code to list of allowed interaction type strings.
+            Mapping of grade code to tuple of allowed interaction type strings.
         """
-        interactions: dict[str, list[str]] = {}
+        interactions: dict[str, tuple[str, ...]] = {}
         if not content:
             return interactions
 
-        section_re = re.compile(r"^## Grade (\w+)", re.MULTILINE)
-        sections = section_re.split(content)
-
-        it = iter(sections[1:])
-        for grade_code, body in zip(it, it):
-            grade_code = grade_code.strip()
-
+        for grade_code, body in _iter_grade_sections(content):
             allowed_start = body.find("### Allowed Types")
             if allowed_start == -1:
                 continue
 
             allowed_body = body[allowed_start:]
             # Trim to just the Allowed Types subsection
-            next_sub = re.search(r"\n###", allowed_body[len("### Allowed Types") :])
+            next_sub = _SUBSECTION_RE.search(allowed_body[len("### Allowed Types") :])
             if next_sub:
                 allowed_body = allowed_body[
                     : len("### Allowed Types") + next_sub.start()
@@ -480,12 +770,50 @@ class KBLoader:
 
             # Extract all types from bold-category lines
             types: list[str] = []
-            cat_re = re.compile(r"\*\*[^:]+:\*\*\s*(.+)")
-            for cat_match in cat_re.finditer(allowed_body):
-                items = [t.strip() for t in cat_match.group(1).split(",") if t.strip()]
-                types.extend(items)
+            for line in allowed_body.splitlines():
+                if not line.startswith("**"):
+                    continue
+                label_end = line.find(":**", 2)
+                if label_end == -1:
+                    continue
+                for item in line[label_end + 3 :].split(","):
+                    item = item.strip()
+                    if item:
+                        types.append(item)
 
             if types:
-                interactions[grade_code] = types
+                interactions[grade_code] = tuple(types)
 
         return interactions
+
+
+# ---------------------------------------------------------------------------
+# Shared loader instances
+# ---------------------------------------------------------------------------
+
+_shared_loader_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _shared_kb_loader(kb_path: Path) -> KBLoader:
+    return KBLoader(kb_path=str(kb_path))
+
+
+def get_kb_loader(kb_path: str | None = None) -> KBLoader:
+    """Return the process-wide :class:`KBLoader` for *kb_path*.
+
+    The in-memory cache lives on the loader instance, so every caller that
+    shares a KB directory should share a loader too; otherwise each one
+    parses the same files again.
+
+    Args:
+        kb_path: Directory containing the ``.md`` KB files.
+                 Defaults to ``Settings.kb_path``.
+
+    Returns:
+        The same :class:`KBLoader` on every call with the same directory.
+    """
+    path = Path(kb_path or get_settings().kb_path)
+    # lru_cache alone may call the factory twice under a race
+    with _shared_loader_lock:
+        return _shared_kb_loader(path)
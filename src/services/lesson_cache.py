@@ -0,0 +1,60 @@
+"""In-process LRU cache of generated lessons.
+
+Claude calls dominate lesson-generation latency and cost, and iterating on
+a chapter tends to re-request identical lessons.  :class:`LessonCache`
+keeps the most recent results keyed by the exact request sent to Claude.
+
+Lessons are stored serialised, so every :meth:`LessonCache.get` returns a
+fresh dict that the caller may mutate freely.
+
+Usage::
+
+    cache = LessonCache(maxsize=256)
+    lesson = cache.get(key)
+    if lesson is None:
+        lesson = await generate(...)
+        cache.put(key, lesson)
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+import orjson
+
+
+class LessonCache:
+    """Bounded least-recently-used mapping of request key → lesson JSON.
+
+    Args:
+        maxsize: Maximum number of lessons kept; ``0`` disables the cache.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> dict[str, Any] | None:
+        """Return a copy of the cached lesson for *key*, or ``None`` on a miss."""
+        payload = self._entries.get(key)
+        if payload is None:
+            return None
+        self._entries.move_to_end(key)
+        lesson: dict[str, Any] = orjson.loads(payload)
+        return lesson
+
+    def put(self, key: Hashable, lesson: dict[str, Any]) -> None:
+        """Store *lesson* under *key*, evicting the least recently used entry."""
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = orjson.dumps(lesson)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached lesson."""
+        self._entries.clear()
@@ -4,21 +4,32 @@ Assembles the master prompt from knowledge base context and the topic
 specification (Section 5.1 of the architecture document), calls the
 Anthropic Claude API, and returns the raw lesson JSON.
 
-Retry policy: 3 attempts with exponential back-off (1 s → 2 s → 4 s).
+Retry policy: 3 attempts with exponential back-off (1 s → 2 s → 4 s) plus up
+to 25 % random jitter; a 429's ``retry-after`` header (capped at 30 s)
+replaces the back-off and gets the same jitter.
+Calls are throttled client-side by a process-wide
+:class:`~src.services.rate_limiter.ClaudeRateLimiter` (``Settings.claude_*``).
 """
 
 import asyncio
-import json
+import functools
 import logging
-import re
+import random
 import time
+from collections.abc import Mapping
 from typing import Any
 
 import anthropic
+import httpx
+import orjson
+from anthropic.types import TextBlockParam
 
 from src.config import get_settings
-from src.exceptions import KBLoadError, LessonGenerationError
+from src.exceptions import CircuitOpenError, KBLoadError, LessonGenerationError
+from src.services.circuit_breaker import CircuitBreaker
 from src.services.kb_loader import KBLoader
+from src.services.lesson_cache import LessonCache
+from src.services.rate_limiter import ClaudeRateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +41,358 @@ _MODEL = "claude-sonnet-4-6"
 _MAX_TOKENS = 8000
 _MAX_RETRIES = 3
 _BACKOFF_BASE_SECONDS = 1  # wait = _BACKOFF_BASE_SECONDS * 2^(attempt-1)
+_BACKOFF_JITTER = 0.25  # extra random wait, as a fraction of the back-off
+_MAX_RETRY_AFTER_SECONDS = 30.0  # upper bound on a server-sent retry-after
+# 4xx statuses worth retrying (as in the SDK); every 5xx is retried too
+_RETRIABLE_STATUS_CODES = frozenset({408, 409, 429})
+_REQUEST_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
+
+# Output schema shown to Claude in the prompt (fixed text)
+_JSON_SCHEMA_BLOCK = """\
+```json
+{
+  "learning_objective": "Students will be able to...",
+  "opening_narration": {
+    "line_1": "Good morning, children.",
+    "line_2": "Have you ever... [Beat]",
+    "line_3": "Today we will learn...",
+    "line_4": "Let us begin..."
+  },
+  "on_screen_opening": {
+    "layout": "...",
+    "static_elements": [],
+    "interactive_elements": [],
+    "animation": "..."
+  },
+  "narrated_explanation": [
+    {
+      "concept_name": "...",
+      "teacher_explains": "...",
+      "bloom_level": "L2",
+      "on_screen": {},
+      "transition": "..."
+    }
+  ],
+  "interactive_activity": {
+    "type": "...",
+    "bloom_level": "L3",
+    "instructions": "...",
+    "on_screen": {},
+    "feedback_hint_1": "...",
+    "feedback_hint_2": "...",
+    "feedback_reveal": "..."
+  },
+  "doubts_discussion": [
+    {
+      "question": "...",
+      "bloom_level": "L2",
+      "answer": "...",
+      "teacher_clarification": "..."
+    }
+  ],
+  "quick_quiz": [
+    {
+      "question_number": 1,
+      "type": "MCQ",
+      "bloom_level": "L1",
+      "prompt": "...",
+      "options": [],
+      "answer": "...",
+      "feedback_correct": "...",
+      "feedback_incorrect": "..."
+    }
+  ],
+  "conclusion": {
+    "recap": "...",
+    "real_life_connection": "...",
+    "reflection_prompt": "..."
+  }
+}
+```"""
+
+# Separates the cacheable KB context from the per-topic lesson request
+_KB_CONTEXT_SEPARATOR = "\n\n---\n\n"
+
+# (label, KB file) for each prompt KB section, in prompt order; labels may
+# reference {grade} and {subject}
+_KB_SECTIONS = (
+    ("PEDAGOGICAL PRINCIPLES", "NCERT_Pedagogical_Style_Knowledge.md"),
+    ("LANGUAGE GUIDELINES FOR GRADE {grade}", "language_guidelines.md"),
+    ("BLOOM'S TAXONOMY FRAMEWORK", "NCERT_Pedagogical_Style_Knowledge.md"),
+    ("DIGITAL INTERACTIONS FOR GRADE {grade}", "digital_interactions.md"),
+    ("QUESTION BANK & FEEDBACK TEMPLATES", "question_bank.md"),
+    ("DEFINITIONS & EXAMPLES FOR {subject}", "definitions_and_examples.md"),
+)
+
+
+# ---------------------------------------------------------------------------
+# Shared Claude clients, rate limiter, circuit breaker and lesson cache
+# ---------------------------------------------------------------------------
+
+# One client (and so one HTTP connection pool) per API key for the process
+_clients: dict[str, anthropic.AsyncAnthropic] = {}
+
+
+def _get_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Return the process-wide Claude client for *api_key*, creating it once.
+
+    SDK-level retries are disabled because
+    :meth:`LessonGenerationOrchestrator._call_claude_with_retry` owns the
+    retry policy.
+    """
+    client = _clients.get(api_key)
+    if client is None:
+        client = anthropic.AsyncAnthropic(
+            api_key=api_key, max_retries=0, timeout=_REQUEST_TIMEOUT
+        )
+        _clients[api_key] = client
+    return client
+
+
+_rate_limiter: ClaudeRateLimiter | None = None
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheap local token estimate (~4 characters per token), rounded up.
+
+    Good enough for proactive throttling and avoids a ``count_tokens``
+    round trip per lesson.
+    """
+    return (len(text) + 3) // 4
+
+
+def _get_rate_limiter() -> ClaudeRateLimiter:
+    """Return the process-wide Claude rate limiter, built from settings on first use."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        settings = get_settings()
+        _rate_limiter = ClaudeRateLimiter(
+            requests_per_minute=settings.claude_requests_per_minute,
+            tokens_per_minute=settings.claude_tokens_per_minute,
+            max_concurrency=settings.claude_max_concurrency,
+        )
+    return _rate_limiter
+
+
+_circuit_breaker: CircuitBreaker | None = None
+
+
+def _get_circuit_breaker() -> CircuitBreaker:
+    """Return the process-wide Claude circuit breaker, built from settings on first use."""
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        settings = get_settings()
+        _circuit_breaker = CircuitBreaker(
+            failure_threshold=settings.claude_breaker_failure_threshold,
+            reset_timeout=settings.claude_breaker_reset_seconds,
+            is_failure=_is_upstream_failure,
+        )
+    return _circuit_breaker
+
+
+_lesson_cache: LessonCache | None = None
+
+
+def _get_lesson_cache() -> LessonCache:
+    """Return the process-wide lesson cache, sized from settings on first use."""
+    global _lesson_cache
+    if _lesson_cache is None:
+        _lesson_cache = LessonCache(maxsize=get_settings().lesson_cache_size)
+    return _lesson_cache
+
+
+async def close_clients() -> None:
+    """Close every shared Claude client; call once on application shutdown."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
+
+
+# ---------------------------------------------------------------------------
+# Static prompt sections
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=64)
+def _static_prompt_sections(
+    kb_loader: KBLoader,
+    kb_checksum: str,
+    grade: str,
+    subject: str,
+    kb_sections: tuple[str, ...],
+) -> tuple[str, str, str]:
+    """Join the topic-independent parts of the master prompt, once per grade.
+
+    Everything outside the lesson specification and the content-isolation
+    lines depends only on the grade, the subject and the loaded KB.
+    *kb_checksum* is part of the cache key so a KB reload rebuilds the
+    sections; *kb_loader* supplies the grade's language, Bloom's and
+    interaction limits.
+
+    Args:
+        kb_loader: Loaded KB the grade limits are read from.
+        kb_checksum: Checksum of the KB that *kb_loader* currently holds.
+        grade: Grade code.
+        subject: Subject name.
+        kb_sections: Raw markdown for each entry of ``_KB_SECTIONS``.
+
+    Returns:
+        ``(head, middle, tail)``: the KB context that precedes the lesson
+        request, the request text between the lesson specification and
+        the content-isolation lines, and the text after those.
+    """
+    ceiling = kb_loader.get_language_ceiling(grade)
+    bloom_dist = kb_loader.get_bloom_distribution(grade)
+    allowed_interactions = kb_loader.get_allowed_interactions(grade)
+
+    bloom_table = ", ".join(f"{k}: {v}" for k, v in sorted(bloom_dist.items()))
+    interactions_str = "\n".join(f"  - {t}" for t in allowed_interactions)
+
+    head = "\n".join(
+        [
+            "# LESSON GENERATION PROMPT — NCERT-ALIGNED, AUDIO-FIRST",
+            "",
+            "## GLOBAL CONTEXT",
+            (
+                "You are Claude, an expert educational content designer for NCERT-aligned"
+                " lessons for Indian primary school students (Grades K–5)."
+            ),
+            "",
+            "## KNOWLEDGE BASE (Loaded Dynamically)",
+            "",
+            "\n\n".join(
+                f"[KB SECTION {i}: {label.format(grade=grade, subject=subject)}]\n{text}"
+                for i, ((label, _), text) in enumerate(zip(_KB_SECTIONS, kb_sections), 1)
+            ),
+        ]
+    )
+    middle = "\n".join(
+        [
+            "",
+            "---",
+            "",
+            "## INSTRUCTION: GENERATE LESSON STRUCTURE",
+            "",
+            "Your task is to generate a complete, production-ready lesson for this topic.",
+            "",
+            "### PHASE 1: PLANNING (Internal, not in output)",
+            "1. Identify 3–5 core concepts to teach",
+            "2. Map each concept to Bloom's level (L1–L4 for this grade)",
+            "3. Select an interactive activity type (must be from the allowed list below)",
+            "4. Plan 6–10 quiz checkpoints aligned to Bloom's progression",
+            "5. Identify any narrative/story context to weave in",
+            "",
+            "### PHASE 2: WRITING",
+            "Output a JSON structure with the following schema:",
+            "",
+            _JSON_SCHEMA_BLOCK,
+            "",
+            "---",
+            "",
+            "## CONSTRAINTS & RULES",
+            "",
+            "### Audio-First Design",
+            "- Every 'Teacher says' line will be spoken aloud by ElevenLabs",
+            "- Use [Beat] for 1-second pauses after questions (let child think)",
+            "- Use [Pause] for 2-second reflection pauses (once per section)",
+            "- Use [Emphasis: word] to mark key vocabulary for vocal stress",
+            f"- Keep spoken sentences short ({ceiling.max_sentence_length} words max for this grade)",  # noqa: E501
+            "",
+            f"### Language Ceiling (Grade {grade})",
+            f"- Max sentence length: {ceiling.max_sentence_length} words",
+            f"- New vocabulary per lesson: {ceiling.max_new_vocab} maximum",
+            f"- Allowed connectors: {', '.join(ceiling.allowed_connectors) or 'simple only'}",
+            "",
+            "### Bloom's Requirements",
+            f"- Quiz must have: {bloom_table}",
+            "- Questions must progress L1 → L5 from Q1 → Q10",
+            "- Activity must be L3 (Apply) or L4 (Analyze)",
+            "",
+            f"### Interaction Types — MUST select from this list for Grade {grade}:",
+            interactions_str,
+            "- Activity type determines visualization method",
+            "",
+            "### Content Isolation",
+        ]
+    )
+    tail = "\n".join(
+        [
+            "",
+            "### Feedback Design",
+            "- Correct feedback: Affirm warmly + restate reasoning",
+            "- Incorrect feedback (Activities): Provide 3-tier hints (nudge → explicit → reveal)",  # noqa: E501
+            "- Incorrect feedback (Quiz): Restate the correct answer + explain why",
+            "",
+            "---",
+            "",
+            "## VALIDATION CHECKLIST (System Will Verify)",
+            "",
+            f"- [ ] No sentence exceeds {ceiling.max_sentence_length} words for Grade {grade}",
+            f"- [ ] All new vocabulary ≤ {ceiling.max_new_vocab} for this lesson",
+            "- [ ] Bloom's distribution matches grade table",
+            f"- [ ] Interaction type in allowed list for Grade {grade}",
+            "- [ ] Activity has multi-tier feedback",
+            "- [ ] Audio markers ([Beat], [Pause], [Emphasis]) present",
+            "- [ ] Quiz progresses L1 → L5",
+            "",
+            "---",
+            "",
+            "## OUTPUT FORMAT",
+            "",
+            (
+                "Return ONLY valid JSON (no markdown fences, no explanation)."
+                " The system will parse, validate, and convert to DOCX."
+            ),
+        ]
+    )
+    return head, middle, tail
+
+
+# ---------------------------------------------------------------------------
+# Retry helpers
+# ---------------------------------------------------------------------------
+
+
+def _is_retriable(exc: Exception) -> bool:
+    """Return ``False`` for Claude API errors that another attempt cannot fix.
+
+    Bad requests, auth/permission failures and other 4xx statuses fail the
+    same way every time; connection errors, timeouts, 408/409/429 and 5xx
+    (including 529 overloaded) are transient.  Unparseable or empty
+    responses carry no API error and are retried.
+    """
+    cause = exc if isinstance(exc, anthropic.APIStatusError) else exc.__cause__
+    if isinstance(cause, anthropic.APIStatusError):
+        return cause.status_code in _RETRIABLE_STATUS_CODES or cause.status_code >= 500
+    return True
+
+
+def _is_upstream_failure(exc: Exception) -> bool:
+    """Return ``True`` if *exc* means Claude itself is unreachable or failing.
+
+    Only connection errors, timeouts and 5xx responses count towards opening
+    the circuit breaker; 4xx and unparseable output show the API answered.
+    """
+    cause = exc if isinstance(exc, anthropic.APIError) else exc.__cause__
+    if isinstance(cause, anthropic.APIConnectionError):
+        return True
+    return isinstance(cause, anthropic.APIStatusError) and cause.status_code >= 500
+
+
+def _retry_after_seconds(exc: Exception) -> float | None:
+    """Return the ``retry-after`` delay of a 429 behind *exc*, if Claude sent one.
+
+    ``_call_claude`` wraps SDK errors in :class:`LessonGenerationError`, so the
+    original :class:`anthropic.APIStatusError` is looked up on ``__cause__``.
+    """
+    cause = exc if isinstance(exc, anthropic.APIStatusError) else exc.__cause__
+    if not isinstance(cause, anthropic.APIStatusError) or cause.status_code != 429:
+        return None
+    try:
+        return max(0.0, float(cause.response.headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
 
 
 # ---------------------------------------------------------------------------
@@ -67,9 +430,14 @@ class LessonGenerationOrchestrator:
         chapter_narrative: str = "",
         prerequisites: list[str] | None = None,
         exclusions: list[str] | None = None,
+        force_refresh: bool = False,
     ) -> dict[str, Any]:
         """Generate a complete lesson JSON for the given topic.
 
+        When ``Settings.lesson_cache_size`` is non-zero, a lesson generated
+        earlier from the identical prompt (same topic spec, KB and model) is
+        returned without calling Claude.
+
         Args:
             topic_data: Dict with at minimum ``topic_name`` key.
             grade: Grade code (``K``, ``1``–``5``).
@@ -78,6 +446,7 @@ class LessonGenerationOrchestrator:
             chapter_narrative: Optional story/context framing from the chapter.
             prerequisites: List of prerequisite topic names (assumed known).
             exclusions: List of concept names that must NOT appear in the lesson.
+            force_refresh: Skip the lesson cache lookup and always call Claude.
 
         Returns:
             Parsed lesson structure as a Python dict (the JSON returned by Claude).
@@ -95,13 +464,13 @@ class LessonGenerationOrchestrator:
         )
 
         try:
-            kb_data = self.kb_loader.load()
+            kb_data = await self.kb_loader.aload()
         except KBLoadError:
             raise
         except Exception as exc:
             raise LessonGenerationError(f"KB load failed: {exc}") from exc
 
-        prompt = self._assemble_prompt(
+        kb_context, prompt = self._assemble_prompt_parts(
             topic_data=topic_data,
             grade=grade,
             subject=subject,
@@ -109,25 +478,23 @@ class LessonGenerationOrchestrator:
             chapter_narrative=chapter_narrative,
             prerequisites=prerequisites or [],
             exclusions=exclusions or [],
-            kb_data_dict={
-                "pedagogy": kb_data.raw_content.get(
-                    "NCERT_Pedagogical_Style_Knowledge.md", ""
-                ),
-                "language_guidelines": kb_data.raw_content.get(
-                    "language_guidelines.md", ""
-                ),
-                "bloom_taxonomy": kb_data.raw_content.get(
-                    "NCERT_Pedagogical_Style_Knowledge.md", ""
-                ),
-                "interactions": kb_data.raw_content.get("digital_interactions.md", ""),
-                "question_bank": kb_data.raw_content.get("question_bank.md", ""),
-                "definitions": kb_data.raw_content.get(
-                    "definitions_and_examples.md", ""
-                ),
-            },
+            raw_content=kb_data.raw_content,
+            kb_checksum=kb_data.checksum,
         )
 
-        lesson_dict = await self._call_claude_with_retry(prompt)
+        # The prompt pins down everything that shapes the lesson
+        cache_key = (_MODEL, kb_context, prompt)
+        lesson_cache = _get_lesson_cache()
+        if not force_refresh:
+            cached = lesson_cache.get(cache_key)
+            if cached is not None:
+                logger.info(
+                    "Lesson cache hit for topic=%r", topic_data.get("topic_name")
+                )
+                return cached
+
+        lesson_dict = await self._call_claude_with_retry(prompt, kb_context)
+        lesson_cache.put(cache_key, lesson_dict)
         elapsed = time.monotonic() - start_time
         logger.info(
             "Lesson generation completed in %.2f seconds for topic=%r",
@@ -136,6 +503,40 @@ class LessonGenerationOrchestrator:
         )
         return lesson_dict
 
+    async def generate_lessons_batch(
+        self,
+        specs: list[dict[str, Any]],
+        max_concurrency: int = 5,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Generate several lessons concurrently (e.g. a whole chapter).
+
+        At most *max_concurrency* lessons from this batch are in flight at
+        once; the process-wide rate limiter still applies on top.
+
+        Args:
+            specs: One dict of :meth:`generate_lesson` keyword arguments per lesson.
+            max_concurrency: Cap on simultaneous generations for this batch
+                (``0`` or less = no cap, as for ``Settings.claude_max_concurrency``).
+
+        Returns:
+            One entry per spec, in order: the lesson dict, or the exception
+            that lesson's generation raised (one failure doesn't cancel the rest).
+        """
+        if max_concurrency <= 0:
+            return await asyncio.gather(
+                *(self.generate_lesson(**spec) for spec in specs), return_exceptions=True
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate_one(spec: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.generate_lesson(**spec)
+
+        return await asyncio.gather(
+            *(generate_one(spec) for spec in specs), return_exceptions=True
+        )
+
     # ------------------------------------------------------------------
     # Prompt assembly
     # ------------------------------------------------------------------
@@ -149,7 +550,8 @@ class LessonGenerationOrchestrator:
         chapter_narrative: str,
         prerequisites: list[str],
         exclusions: list[str],
-        kb_data_dict: dict[str, str],
+        raw_content: Mapping[str, str],
+        kb_checksum: str,
     ) -> str:
         """Assemble the master prompt from KB context and topic spec (Section 5.1).
 
@@ -161,52 +563,74 @@ class LessonGenerationOrchestrator:
             chapter_narrative: Optional story context.
             prerequisites: Prerequisite concept names.
             exclusions: Concept names to exclude.
-            kb_data_dict: Mapping of KB section name → raw markdown content.
+            raw_content: KB filename → raw markdown (``KBData.raw_content``);
+                missing files appear as ``(not loaded)``.
+            kb_checksum: ``KBData.checksum`` of the KB *raw_content* came from.
 
         Returns:
-            Complete prompt string ready for the Claude API.
+            Complete prompt string: the KB context followed by the lesson request.
         """
-        topic_name = topic_data.get("topic_name", "Unknown Topic")
-        ceiling = self.kb_loader.get_language_ceiling(grade)
-        bloom_dist = self.kb_loader.get_bloom_distribution(grade)
-        allowed_interactions = self.kb_loader.get_allowed_interactions(grade)
+        return _KB_CONTEXT_SEPARATOR.join(
+            self._assemble_prompt_parts(
+                topic_data=topic_data,
+                grade=grade,
+                subject=subject,
+                chapter_name=chapter_name,
+                chapter_narrative=chapter_narrative,
+                prerequisites=prerequisites,
+                exclusions=exclusions,
+                raw_content=raw_content,
+                kb_checksum=kb_checksum,
+            )
+        )
+
+    def _assemble_prompt_parts(
+        self,
+        topic_data: dict[str, Any],
+        grade: str,
+        subject: str,
+        chapter_name: str,
+        chapter_narrative: str,
+        prerequisites: list[str],
+        exclusions: list[str],
+        raw_content: Mapping[str, str],
+        kb_checksum: str,
+    ) -> tuple[str, str]:
+        """Assemble the master prompt as ``(kb_context, lesson_request)``.
+
+        *kb_context* (preamble + KB sections) is identical for every topic of
+        a grade and subject, so it is sent as a cached system block.  Only
+        the lesson specification and content-isolation lines are built per
+        call; the rest comes from :func:`_static_prompt_sections`.
+
+        Args:
+            topic_data: Must contain ``topic_name``.
+            grade: Grade code.
+            subject: Subject name.
+            chapter_name: Chapter title.
+            chapter_narrative: Optional story context.
+            prerequisites: Prerequisite concept names.
+            exclusions: Concept names to exclude.
+            raw_content: KB filename → raw markdown (``KBData.raw_content``);
+                missing files appear as ``(not loaded)``.
+            kb_checksum: ``KBData.checksum`` of the KB *raw_content* came from.
 
-        bloom_table = ", ".join(f"{k}: {v}" for k, v in sorted(bloom_dist.items()))
-        interactions_str = "\n".join(f"  - {t}" for t in allowed_interactions)
+        Returns:
+            The KB context and the topic-specific lesson request.
+        """
+        topic_name = topic_data.get("topic_name", "Unknown Topic")
         prereq_str = ", ".join(prerequisites) if prerequisites else "None"
         exclusions_str = ", ".join(exclusions) if exclusions else "None"
 
+        head, middle, tail = _static_prompt_sections(
+            self.kb_loader,
+            kb_checksum,
+            grade,
+            subject,
+            tuple(raw_content.get(filename) or "(not loaded)" for _, filename in _KB_SECTIONS),
+        )
+
         parts: list[str] = [
-            "# LESSON GENERATION PROMPT — NCERT-ALIGNED, AUDIO-FIRST",
-            "",
-            "## GLOBAL CONTEXT",
-            (
-                "You are Claude, an expert educational content designer for NCERT-aligned"
-                " lessons for Indian primary school students (Grades K–5)."
-            ),
-            "",
-            "## KNOWLEDGE BASE (Loaded Dynamically)",
-            "",
-            "[KB SECTION 1: PEDAGOGICAL PRINCIPLES]",
-            kb_data_dict.get("pedagogy", "(not loaded)"),
-            "",
-            f"[KB SECTION 2: LANGUAGE GUIDELINES FOR GRADE {grade}]",
-            kb_data_dict.get("language_guidelines", "(not loaded)"),
-            "",
-            "[KB SECTION 3: BLOOM'S TAXONOMY FRAMEWORK]",
-            kb_data_dict.get("bloom_taxonomy", "(not loaded)"),
-            "",
-            f"[KB SECTION 4: DIGITAL INTERACTIONS FOR GRADE {grade}]",
-            kb_data_dict.get("interactions", "(not loaded)"),
-            "",
-            "[KB SECTION 5: QUESTION BANK & FEEDBACK TEMPLATES]",
-            kb_data_dict.get("question_bank", "(not loaded)"),
-            "",
-            f"[KB SECTION 6: DEFINITIONS & EXAMPLES FOR {subject}]",
-            kb_data_dict.get("definitions", "(not loaded)"),
-            "",
-            "---",
-            "",
             "## LESSON SPECIFICATION",
             "",
             f"**Topic:** {topic_name}",
@@ -217,110 +641,7 @@ class LessonGenerationOrchestrator:
             "",
             f"**Topic Prerequisites:** {prereq_str}",
             f"**Content to EXCLUDE:** {exclusions_str}",
-            "",
-            "---",
-            "",
-            "## INSTRUCTION: GENERATE LESSON STRUCTURE",
-            "",
-            "Your task is to generate a complete, production-ready lesson for this topic.",
-            "",
-            "### PHASE 1: PLANNING (Internal, not in output)",
-            "1. Identify 3–5 core concepts to teach",
-            "2. Map each concept to Bloom's level (L1–L4 for this grade)",
-            "3. Select an interactive activity type (must be from the allowed list below)",
-            "4. Plan 6–10 quiz checkpoints aligned to Bloom's progression",
-            "5. Identify any narrative/story context to weave in",
-            "",
-            "### PHASE 2: WRITING",
-            "Output a JSON structure with the following schema:",
-            "",
-            "```json",
-            "{",
-            '  "learning_objective": "Students will be able to...",',
-            '  "opening_narration": {',
-            '    "line_1": "Good morning, children.",',
-            '    "line_2": "Have you ever... [Beat]",',
-            '    "line_3": "Today we will learn...",',
-            '    "line_4": "Let us begin..."',
-            "  },",
-            '  "on_screen_opening": {',
-            '    "layout": "...",',
-            '    "static_elements": [],',
-            '    "interactive_elements": [],',
-            '    "animation": "..."',
-            "  },",
-            '  "narrated_explanation": [',
-            "    {",
-            '      "concept_name": "...",',
-            '      "teacher_explains": "...",',
-            '      "bloom_level": "L2",',
-            '      "on_screen": {},',
-            '      "transition": "..."',
-            "    }",
-            "  ],",
-            '  "interactive_activity": {',
-            '    "type": "...",',
-            '    "bloom_level": "L3",',
-            '    "instructions": "...",',
-            '    "on_screen": {},',
-            '    "feedback_hint_1": "...",',
-            '    "feedback_hint_2": "...",',
-            '    "feedback_reveal": "..."',
-            "  },",
-            '  "doubts_discussion": [',
-            "    {",
-            '      "question": "...",',
-            '      "bloom_level": "L2",',
-            '      "answer": "...",',
-            '      "teacher_clarification": "..."',
-            "    }",
-            "  ],",
-            '  "quick_quiz": [',
-            "    {",
-            '      "question_number": 1,',
-            '      "type": "MCQ",',
-            '      "bloom_level": "L1",',
-            '      "prompt": "...",',
-            '      "options": [],',
-            '      "answer": "...",',
-            '      "feedback_correct": "...",',
-            '      "feedback_incorrect": "..."',
-            "    }",
-            "  ],",
-            '  "conclusion": {',
-            '    "recap": "...",',
-            '    "real_life_connection": "...",',
-            '    "reflection_prompt": "..."',
-            "  }",
-            "}",
-            "```",
-            "",
-            "---",
-            "",
-            "## CONSTRAINTS & RULES",
-            "",
-            "### Audio-First Design",
-            "- Every 'Teacher says' line will be spoken aloud by ElevenLabs",
-            "- Use [Beat] for 1-second pauses after questions (let child think)",
-            "- Use [Pause] for 2-second reflection pauses (once per section)",
-            "- Use [Emphasis: word] to mark key vocabulary for vocal stress",
-            f"- Keep spoken sentences short ({ceiling.max_sentence_length} words max for this grade)",  # noqa: E501
-            "",
-            f"### Language Ceiling (Grade {grade})",
-            f"- Max sentence length: {ceiling.max_sentence_length} words",
-            f"- New vocabulary per lesson: {ceiling.max_new_vocab} maximum",
-            f"- Allowed connectors: {', '.join(ceiling.allowed_connectors) or 'simple only'}",
-            "",
-            "### Bloom's Requirements",
-            f"- Quiz must have: {bloom_table}",
-            "- Questions must progress L1 → L5 from Q1 → Q10",
-            "- Activity must be L3 (Apply) or L4 (Analyze)",
-            "",
-            f"### Interaction Types — MUST select from this list for Grade {grade}:",
-            interactions_str,
-            "- Activity type determines visualization method",
-            "",
-            "### Content Isolation",
+            middle,
             f"- Do NOT teach concepts in: {exclusions_str}",
             f"- Assume prerequisites are met: {prereq_str}",
         ]
@@ -330,66 +651,57 @@ class LessonGenerationOrchestrator:
                 f'- Reference chapter narrative if provided: "{chapter_narrative}"'
             )
 
-        parts.extend(
-            [
-                "",
-                "### Feedback Design",
-                "- Correct feedback: Affirm warmly + restate reasoning",
-                "- Incorrect feedback (Activities): Provide 3-tier hints (nudge → explicit → reveal)",  # noqa: E501
-                "- Incorrect feedback (Quiz): Restate the correct answer + explain why",
-                "",
-                "---",
-                "",
-                "## VALIDATION CHECKLIST (System Will Verify)",
-                "",
-                f"- [ ] No sentence exceeds {ceiling.max_sentence_length} words for Grade {grade}",
-                f"- [ ] All new vocabulary ≤ {ceiling.max_new_vocab} for this lesson",
-                "- [ ] Bloom's distribution matches grade table",
-                f"- [ ] Interaction type in allowed list for Grade {grade}",
-                "- [ ] Activity has multi-tier feedback",
-                "- [ ] Audio markers ([Beat], [Pause], [Emphasis]) present",
-                "- [ ] Quiz progresses L1 → L5",
-                "",
-                "---",
-                "",
-                "## OUTPUT FORMAT",
-                "",
-                (
-                    "Return ONLY valid JSON (no markdown fences, no explanation)."
-                    " The system will parse, validate, and convert to DOCX."
-                ),
-            ]
-        )
-
-        return "\n".join(parts)
+        parts.append(tail)
+        return head, "\n".join(parts)
 
     # ------------------------------------------------------------------
     # Claude API calls with retry
     # ------------------------------------------------------------------
 
-    async def _call_claude_with_retry(self, prompt: str) -> dict[str, Any]:
+    async def _call_claude_with_retry(
+        self, prompt: str, kb_context: str = ""
+    ) -> dict[str, Any]:
         """Call the Claude API up to _MAX_RETRIES times with exponential back-off.
 
         Args:
-            prompt: Fully assembled lesson generation prompt.
+            prompt: Lesson request (or the fully assembled prompt).
+            kb_context: Optional KB context sent as a cached system block.
 
         Returns:
             Parsed lesson dict from Claude's JSON response.
 
         Raises:
-            LessonGenerationError: After all retries are exhausted.
+            LessonGenerationError: After all retries are exhausted, or at once
+                for a non-retriable API error (e.g. 400, 401, 403, 404).
+            CircuitOpenError: At once while the circuit breaker is open after
+                repeated upstream failures.
         """
         last_exc: Exception | None = None
         for attempt in range(1, _MAX_RETRIES + 1):
             try:
-                return await self._call_claude(prompt, attempt)
+                return await _get_circuit_breaker().call(
+                    lambda: self._call_claude(prompt, attempt, kb_context)
+                )
+            except CircuitOpenError:
+                raise
             except (LessonGenerationError, anthropic.APIError) as exc:
                 last_exc = exc
                 logger.warning(
                     "Claude API attempt %d/%d failed: %s", attempt, _MAX_RETRIES, exc
                 )
+                if not _is_retriable(exc):
+                    raise LessonGenerationError(
+                        f"Lesson generation failed (not retriable): {exc}",
+                        attempt=attempt,
+                    ) from exc
                 if attempt < _MAX_RETRIES:
-                    wait = _BACKOFF_BASE_SECONDS * (2 ** (attempt - 1))
+                    retry_after = _retry_after_seconds(exc)
+                    if retry_after is None:
+                        base = _BACKOFF_BASE_SECONDS * (2 ** (attempt - 1))
+                    else:
+                        base = min(retry_after, _MAX_RETRY_AFTER_SECONDS)
+                    # Jitter either way so callers hit by the same 429 don't retry in lockstep
+                    wait = base + random.uniform(0, base * _BACKOFF_JITTER)
                     logger.info("Retrying in %.1f seconds…", wait)
                     await asyncio.sleep(wait)
 
@@ -399,12 +711,16 @@ class LessonGenerationOrchestrator:
             attempt=_MAX_RETRIES,
         )
 
-    async def _call_claude(self, prompt: str, attempt: int = 1) -> dict[str, Any]:
+    async def _call_claude(
+        self, prompt: str, attempt: int = 1, kb_context: str = ""
+    ) -> dict[str, Any]:
         """Make a single Claude API call and parse the JSON response.
 
         Args:
-            prompt: Assembled lesson generation prompt.
+            prompt: Lesson request (or the fully assembled prompt).
             attempt: Current retry attempt number (for logging).
+            kb_context: Optional KB context, sent as a system block marked for
+                prompt caching so repeat calls don't re-process the KB.
 
         Returns:
             Parsed lesson structure dict.
@@ -419,15 +735,34 @@ class LessonGenerationOrchestrator:
                 "Set it via environment variable or .env file."
             )
 
-        logger.debug("Calling Claude API (attempt %d, model=%s)", attempt, _MODEL)
-
-        client = anthropic.AsyncAnthropic(api_key=self._api_key)
+        client = _get_client(self._api_key)
+        system: list[TextBlockParam] | anthropic.Omit = anthropic.omit
+        if kb_context:
+            system = [
+                {
+                    "type": "text",
+                    "text": kb_context,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        est_tokens = _estimate_tokens(kb_context) + _estimate_tokens(prompt) + _MAX_TOKENS
+        logger.debug(
+            "Calling Claude API (attempt %d, model=%s): prompt=%d chars, "
+            "cached KB=%d chars, ~%d tokens incl. output budget",
+            attempt,
+            _MODEL,
+            len(prompt),
+            len(kb_context),
+            est_tokens,
+        )
         try:
-            message = await client.messages.create(
-                model=_MODEL,
-                max_tokens=_MAX_TOKENS,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            async with _get_rate_limiter().limit(est_tokens):
+                message = await client.messages.create(
+                    model=_MODEL,
+                    max_tokens=_MAX_TOKENS,
+                    system=system,
+                    messages=[{"role": "user", "content": prompt}],
+                )
         except anthropic.APIStatusError as exc:
             raise LessonGenerationError(
                 f"Claude API status error: {exc.status_code} — {exc.message}"
@@ -435,9 +770,10 @@ class LessonGenerationOrchestrator:
         except anthropic.APIConnectionError as exc:
             raise LessonGenerationError(f"Claude API connection error: {exc}") from exc
 
+        # First text block; thinking / tool_use blocks may precede it
         raw_text: str = ""
         for block in message.content:
-            if hasattr(block, "text"):
+            if block.type == "text":
                 raw_text = block.text
                 break
 
@@ -464,13 +800,17 @@ class LessonGenerationOrchestrator:
         text = raw_text.strip()
 
         # Strip optional markdown code fence wrappers
-        text = re.sub(r"^```(?:json)?\s*\n?", "", text, flags=re.IGNORECASE)
-        text = re.sub(r"\n?```\s*$", "", text, flags=re.IGNORECASE)
+        if text.startswith("```"):
+            text = text[3:]
+            if text[:4].lower() == "json":
+                text = text[4:]
+        if text.endswith("```"):
+            text = text[:-3]
         text = text.strip()
 
         try:
-            lesson: dict[str, Any] = json.loads(text)
-        except json.JSONDecodeError as exc:
+            lesson: dict[str, Any] = orjson.loads(text)
+        except orjson.JSONDecodeError as exc:
             logger.error(
                 "Failed to parse Claude JSON response (first 500 chars): %s",
                 text[:500],
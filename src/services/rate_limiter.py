@@ -0,0 +1,113 @@
+"""Client-side rate limiting for Claude API calls.
+
+Anthropic enforces requests-per-minute and tokens-per-minute limits per
+organisation and answers overshoot with 429s.  :class:`ClaudeRateLimiter`
+throttles calls *before* they are sent, over a sliding 60-second window,
+and caps how many calls are in flight at once.
+
+Usage::
+
+    limiter = ClaudeRateLimiter(requests_per_minute=50, tokens_per_minute=0,
+                                max_concurrency=8)
+    async with limiter.limit(estimated_tokens):
+        message = await client.messages.create(...)
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+
+class ClaudeRateLimiter:
+    """Sliding-window RPM/TPM limiter with a concurrency cap.
+
+    A limit of ``0`` disables that dimension.  A single request estimated
+    above the whole token budget is let through once the window is empty
+    rather than waiting forever.
+
+    Args:
+        requests_per_minute: Maximum requests started per window.
+        tokens_per_minute: Maximum estimated tokens started per window.
+        max_concurrency: Maximum requests in flight at once.
+        window_seconds: Length of the sliding window (60 s for Anthropic limits).
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_concurrency: int,
+        window_seconds: float = 60.0,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window_seconds = window_seconds
+        self._requests: deque[float] = deque()
+        self._tokens: deque[tuple[float, int]] = deque()
+        self._tokens_in_window = 0
+        # Waiters queue here in arrival order while one of them sleeps
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+
+    async def acquire(self, est_tokens: int) -> None:
+        """Wait until a request of *est_tokens* fits every limit, then record it.
+
+        Args:
+            est_tokens: Estimated input + output tokens for the request.
+        """
+        if self._slots is not None:
+            await self._slots.acquire()
+        try:
+            async with self._lock:
+                while True:
+                    wait = self._seconds_until_room(est_tokens, time.monotonic())
+                    if wait <= 0:
+                        break
+                    logger.debug("Claude rate limit reached; waiting %.2f s", wait)
+                    await asyncio.sleep(wait)
+                now = time.monotonic()
+                self._requests.append(now)
+                if self.tokens_per_minute:
+                    self._tokens.append((now, est_tokens))
+                    self._tokens_in_window += est_tokens
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """Free the concurrency slot taken by :meth:`acquire`."""
+        if self._slots is not None:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def limit(self, est_tokens: int) -> AsyncIterator[None]:
+        """Hold a rate-limit slot for the duration of the ``async with`` block."""
+        await self.acquire(est_tokens)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _seconds_until_room(self, est_tokens: int, now: float) -> float:
+        """Drop expired entries and return how long until *est_tokens* fits."""
+        horizon = now - self.window_seconds
+        while self._requests and self._requests[0] <= horizon:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= horizon:
+            self._tokens_in_window -= self._tokens.popleft()[1]
+
+        wait = 0.0
+        if self.requests_per_minute and len(self._requests) >= self.requests_per_minute:
+            wait = self._requests[0] - horizon
+        if (
+            self.tokens_per_minute
+            and self._tokens
+            and self._tokens_in_window + est_tokens > self.tokens_per_minute
+        ):
+            wait = max(wait, self._tokens[0][0] - horizon)
+        return wait
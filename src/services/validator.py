@@ -5,11 +5,15 @@ Validates generated lesson data against KB constraints deterministically.
 Never raises unhandled exceptions — always returns a ValidationReport.
 """
 
+import asyncio
+import functools
 import re
-import json
 import logging
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from types import MappingProxyType
 from typing import Any, Optional
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +22,7 @@ logger = logging.getLogger(__name__)
 # Grade-level constants (from language_guidelines.md Quick Reference Table)
 # ---------------------------------------------------------------------------
 
-LANGUAGE_CEILINGS: dict[str, dict[str, Any]] = {
+LANGUAGE_CEILINGS: Mapping[str, Mapping[str, Any]] = {
     "K": {"max_sentence_length": 7, "new_vocab_max": 3},
     "1": {"max_sentence_length": 8, "new_vocab_max": 4},
     "2": {"max_sentence_length": 10, "new_vocab_max": 5},
@@ -28,7 +32,7 @@ LANGUAGE_CEILINGS: dict[str, dict[str, Any]] = {
 }
 
 # Bloom's distribution per grade (from NCERT_Pedagogical_Style_Knowledge.md)
-BLOOM_DISTRIBUTION: dict[str, dict[str, int]] = {
+BLOOM_DISTRIBUTION: Mapping[str, Mapping[str, int]] = {
     "K": {"L1": 4, "L2": 4, "L3": 2, "L4": 0, "L5": 0},
     "1": {"L1": 3, "L2": 4, "L3": 2, "L4": 1, "L5": 0},
     "2": {"L1": 3, "L2": 3, "L3": 2, "L4": 1, "L5": 1},
@@ -38,7 +42,7 @@ BLOOM_DISTRIBUTION: dict[str, dict[str, int]] = {
 }
 
 # Allowed interaction types per grade (from digital_interactions.md)
-ALLOWED_INTERACTIONS: dict[str, list[str]] = {
+ALLOWED_INTERACTIONS: Mapping[str, Sequence[str]] = {
     "K": [
         "Tap to Select", "Tap All That Apply", "Tap to Count",
         "Tap in Sequence", "Tap Yes / No", "Reveal on Tap", "Tap to Build",
@@ -100,6 +104,53 @@ ALLOWED_INTERACTIONS: dict[str, list[str]] = {
     ],
 }
 
+# Freeze the grade tables: they are read by every validation (in worker
+# threads) and must not be mutated through a report's details
+LANGUAGE_CEILINGS = MappingProxyType(
+    {grade: MappingProxyType(dict(ceiling)) for grade, ceiling in LANGUAGE_CEILINGS.items()}
+)
+BLOOM_DISTRIBUTION = MappingProxyType(
+    {grade: MappingProxyType(dict(dist)) for grade, dist in BLOOM_DISTRIBUTION.items()}
+)
+ALLOWED_INTERACTIONS = MappingProxyType(
+    {grade: tuple(names) for grade, names in ALLOWED_INTERACTIONS.items()}
+)
+
+# Per-grade lookups flattened once at import for the hot checks
+_CEILING_TUPLES: dict[str, tuple[int, int]] = {
+    grade: (ceiling["max_sentence_length"], ceiling["new_vocab_max"])
+    for grade, ceiling in LANGUAGE_CEILINGS.items()
+}
+
+_BLOOM_LEVELS = ("L1", "L2", "L3", "L4", "L5")
+_BLOOM_TUPLES: dict[str, tuple[int, ...]] = {
+    grade: tuple(dist[level] for level in _BLOOM_LEVELS)
+    for grade, dist in BLOOM_DISTRIBUTION.items()
+}
+
+# Cap on example sentences/issues listed in a check's details
+_MAX_REPORTED_ISSUES = 5
+
+# Case-folded lookup sets for interaction_type_check membership tests
+_ALLOWED_INTERACTIONS_LOWER: dict[str, frozenset[str]] = {
+    grade: frozenset(name.lower() for name in names)
+    for grade, names in ALLOWED_INTERACTIONS.items()
+}
+
+# ---------------------------------------------------------------------------
+# Precompiled patterns (shared by every check on every validation)
+# ---------------------------------------------------------------------------
+
+# One alternation for all three audio markers; the named group that matched
+# (``match.lastgroup``) identifies the marker kind
+_RE_AUDIO_MARKERS = re.compile(
+    r"\[(?:(?P<beat>Beat)|(?P<pause>Pause)|Emphasis:\s*(?P<emphasis>\w+))\]"
+)
+_RE_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+# A whitespace-delimited token containing at least one ASCII letter or digit
+_RE_WORD_TOKEN = re.compile(r"[^\sa-zA-Z0-9]*[a-zA-Z0-9]\S*")
+_RE_WORD = re.compile(r"\b\w+\b")
+
 
 # ---------------------------------------------------------------------------
 # Data classes for validation results
@@ -113,7 +164,12 @@ class CheckResult:
     message: str = ""
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "status": self.status,
+            "details": self.details,
+            "message": self.message,
+        }
 
 
 @dataclass
@@ -123,10 +179,15 @@ class ValidationReport:
     warnings: list[dict[str, Any]] = field(default_factory=list)
     errors: list[dict[str, Any]] = field(default_factory=list)
     overall_score: float = 1.0
+    # Running tallies kept by add_check so compute_score needs no re-scan
+    _passed_count: int = field(default=0, init=False, repr=False, compare=False)
+    _warned_count: int = field(default=0, init=False, repr=False, compare=False)
 
     def add_check(self, check: CheckResult) -> None:
         self.checks.append(check)
-        if check.status == "failed":
+        if check.status == "passed":
+            self._passed_count += 1
+        elif check.status == "failed":
             self.passed = False
             self.errors.append({
                 "type": check.name,
@@ -134,6 +195,7 @@ class ValidationReport:
                 "severity": "high",
             })
         elif check.status == "warning":
+            self._warned_count += 1
             self.warnings.append({
                 "type": check.name,
                 "message": check.message,
@@ -141,13 +203,11 @@ class ValidationReport:
             })
 
     def compute_score(self) -> None:
-        if not self.checks:
+        total = len(self.checks)
+        if not total:
             self.overall_score = 0.0
             return
-        total = len(self.checks)
-        passed = sum(1 for c in self.checks if c.status == "passed")
-        warned = sum(1 for c in self.checks if c.status == "warning")
-        self.overall_score = round((passed + warned * 0.5) / total, 2)
+        self.overall_score = round((self._passed_count + self._warned_count * 0.5) / total, 2)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -164,38 +224,90 @@ class ValidationReport:
 # ---------------------------------------------------------------------------
 
 def _extract_all_text(lesson_data: dict) -> str:
-    """Recursively extract all string values from lesson_data into one blob."""
+    """Extract all string values from lesson_data, depth-first, into one blob."""
     texts: list[str] = []
-
-    def _recurse(obj: Any) -> None:
+    # Explicit stack instead of recursion; children are pushed reversed so
+    # strings come out in document order
+    stack: list[Any] = [lesson_data]
+    while stack:
+        obj = stack.pop()
         if isinstance(obj, str):
             texts.append(obj)
         elif isinstance(obj, dict):
-            for v in obj.values():
-                _recurse(v)
+            if obj:
+                stack.extend(reversed(obj.values()))
         elif isinstance(obj, list):
-            for item in obj:
-                _recurse(item)
-
-    _recurse(lesson_data)
+            if obj:
+                stack.extend(reversed(obj))
     return " ".join(texts)
 
 
-def _extract_sentences(text: str) -> list[str]:
-    """Split text into sentences, stripping audio markers."""
-    # Remove audio markers before splitting
-    cleaned = re.sub(r"\[Beat\]", "", text)
-    cleaned = re.sub(r"\[Pause\]", "", cleaned)
-    cleaned = re.sub(r"\[Emphasis:\s*\w+\]", "", cleaned)
-    # Split on sentence-ending punctuation
-    sentences = re.split(r'(?<=[.!?])\s+', cleaned.strip())
-    return [s.strip() for s in sentences if s.strip()]
+def _split_sentences(cleaned: str) -> list[str]:
+    """Split marker-free text on sentence-ending punctuation."""
+    # The split consumes the whitespace between sentences, so once the ends
+    # are stripped every piece is already non-empty and trimmed
+    cleaned = cleaned.strip()
+    return _RE_SENTENCE_SPLIT.split(cleaned) if cleaned else []
+
+
+@dataclass
+class _LessonScan:
+    """Everything the text-based checks derive from one lesson, computed once."""
+
+    all_text: str
+    sentences: list[str]
+    beats: int = 0
+    pauses: int = 0
+    emphasis_words: list[str] = field(default_factory=list)
+
+    @functools.cached_property
+    def all_text_lower(self) -> str:
+        """Lowercased ``all_text``, built on first use and shared by every check."""
+        return self.all_text.lower()
+
+
+def _scan_lesson(lesson_data: dict) -> _LessonScan:
+    """Walk *lesson_data* once and derive the shared text, sentences and markers.
+
+    A single pass of the audio-marker pattern both tallies the markers and
+    cuts them out of the text that is split into sentences.
+    """
+    all_text = _extract_all_text(lesson_data)
+    beats = pauses = 0
+    emphasis_words: list[str] = []
+    pieces: list[str] = []
+    pos = 0
+    for match in _RE_AUDIO_MARKERS.finditer(all_text):
+        pieces.append(all_text[pos:match.start()])
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == "beat":
+            beats += 1
+        elif kind == "pause":
+            pauses += 1
+        else:
+            emphasis_words.append(match.group("emphasis"))
+    pieces.append(all_text[pos:])
+    return _LessonScan(
+        all_text=all_text,
+        sentences=_split_sentences("".join(pieces)),
+        beats=beats,
+        pauses=pauses,
+        emphasis_words=emphasis_words,
+    )
 
 
 def _count_words(sentence: str) -> int:
     """Count words in a sentence, ignoring punctuation-only tokens."""
-    words = sentence.split()
-    return len([w for w in words if re.search(r'[a-zA-Z0-9]', w)])
+    return len(_RE_WORD_TOKEN.findall(sentence))
+
+
+def _find_terms(terms: Iterable[str], text_lower: str) -> set[str]:
+    """Return the case-folded *terms* that occur in *text_lower*.
+
+    Each distinct term is searched once, however often it is repeated.
+    """
+    return {term for term in {t.lower() for t in terms} if term in text_lower}
 
 
 def _safe_get(data: dict, *keys: str, default: Any = None) -> Any:
@@ -241,9 +353,28 @@ class LessonValidator:
         """
         Run all 8 validation checks and return a ValidationReport.
         Never raises — all exceptions caught and reported.
+
+        The checks are CPU-bound regex and dict walks, so they run together
+        in a worker thread to keep a large lesson from stalling the event loop.
         """
+        return await asyncio.to_thread(
+            self._run_checks,
+            lesson_data=lesson_data,
+            grade=grade,
+            subject=subject,
+            exclusions=exclusions or [],
+            prerequisites=prerequisites or [],
+            context_narrative=context_narrative or "",
+            kb_definitions=kb_definitions or {},
+        )
+
+    def _run_checks(self, lesson_data: dict[str, Any], **check_kwargs: Any) -> ValidationReport:
+        """Run every check with *check_kwargs*, in order, and score the report."""
         report = ValidationReport()
 
+        # Walk the lesson once and share the derived text with every check
+        check_kwargs.update(lesson_data=lesson_data, scan=_scan_lesson(lesson_data))
+
         checks = [
             ("language_ceiling", self.language_ceiling_check),
             ("blooms_distribution", self.blooms_distribution_check),
@@ -257,15 +388,7 @@ class LessonValidator:
 
         for check_name, check_fn in checks:
             try:
-                result = check_fn(
-                    lesson_data=lesson_data,
-                    grade=grade,
-                    subject=subject,
-                    exclusions=exclusions or [],
-                    prerequisites=prerequisites or [],
-                    context_narrative=context_narrative or "",
-                    kb_definitions=kb_definitions or {},
-                )
+                result = check_fn(**check_kwargs)
                 report.add_check(result)
             except Exception as exc:
                 logger.error("Validation check '%s' raised: %s", check_name, exc)
@@ -283,19 +406,26 @@ class LessonValidator:
     # CHECK a) Language Ceiling
     # ------------------------------------------------------------------
 
-    def language_ceiling_check(self, lesson_data: dict, grade: str, **_kwargs) -> CheckResult:
+    def language_ceiling_check(
+        self,
+        lesson_data: dict,
+        grade: str,
+        scan: Optional[_LessonScan] = None,
+        **_kwargs,
+    ) -> CheckResult:
         """
         For each sentence: word_count <= max_for_grade.
         For each section: new_vocab_count <= allowed_for_grade.
         """
-        ceiling = LANGUAGE_CEILINGS.get(grade, LANGUAGE_CEILINGS["3"])
-        max_len = ceiling["max_sentence_length"]
-        max_vocab = ceiling["new_vocab_max"]
+        max_len, max_vocab = _CEILING_TUPLES.get(grade, _CEILING_TUPLES["3"])
 
-        all_text = _extract_all_text(lesson_data)
-        sentences = _extract_sentences(all_text)
+        if scan is None:
+            scan = _scan_lesson(lesson_data)
+        sentences = scan.sentences
 
+        # Count every violation but only keep the first few for the report
         violations: list[dict[str, Any]] = []
+        violations_count = 0
         max_found = 0
 
         for sent in sentences:
@@ -303,16 +433,17 @@ class LessonValidator:
             if wc > max_found:
                 max_found = wc
             if wc > max_len:
-                violations.append({
-                    "sentence": sent[:80],
-                    "word_count": wc,
-                    "max_allowed": max_len,
-                })
+                violations_count += 1
+                if len(violations) < _MAX_REPORTED_ISSUES:
+                    violations.append({
+                        "sentence": sent[:80],
+                        "word_count": wc,
+                        "max_allowed": max_len,
+                    })
 
         # Count new vocabulary (words introduced for the first time)
         # Heuristic: words marked with [Emphasis: word] are new vocab
-        emphasis_matches = re.findall(r'\[Emphasis:\s*(\w+)\]', all_text)
-        new_vocab_count = len(set(emphasis_matches))
+        new_vocab_count = len(set(scan.emphasis_words))
 
         vocab_exceeded = new_vocab_count > max_vocab
 
@@ -320,8 +451,8 @@ class LessonValidator:
             "max_sentence_length": max_len,
             "sentences_checked": len(sentences),
             "max_found": max_found,
-            "violations_count": len(violations),
-            "violations": violations[:5],  # cap at 5 for readability
+            "violations_count": violations_count,
+            "violations": violations,
             "new_vocab_count": new_vocab_count,
             "new_vocab_max": max_vocab,
             "vocab_exceeded": vocab_exceeded,
@@ -333,7 +464,8 @@ class LessonValidator:
                 status="failed",
                 details=details,
                 message=(
-                    f"{len(violations)} sentence(s) exceed max length {max_len} for grade {grade}. "
+                    f"{violations_count} sentence(s) exceed max length {max_len} "
+                    f"for grade {grade}. "
                     f"New vocab: {new_vocab_count}/{max_vocab}."
                 ),
             )
@@ -354,7 +486,7 @@ class LessonValidator:
         Verify matches grade distribution table.
         Verify progression: Q1-Q3 are L1/L2, Q8-Q10 are L3-L5.
         """
-        expected = BLOOM_DISTRIBUTION.get(grade, BLOOM_DISTRIBUTION["3"])
+        expected = dict(BLOOM_DISTRIBUTION.get(grade, BLOOM_DISTRIBUTION["3"]))
         quiz = lesson_data.get("quick_quiz", [])
 
         if not quiz:
@@ -365,29 +497,25 @@ class LessonValidator:
                 message="Quick quiz section is missing from lesson data.",
             )
 
-        actual: dict[str, int] = {"L1": 0, "L2": 0, "L3": 0, "L4": 0, "L5": 0}
-        for q in quiz:
-            bl = q.get("bloom_level", "").upper().strip()
-            if bl in actual:
-                actual[bl] += 1
-
-        distribution_match = all(actual.get(k, 0) == v for k, v in expected.items())
-
-        # Progression check: Q1-Q3 should be L1/L2, Q8-Q10 should be L3-L5
-        progression_ok = True
+        # Tally levels and check progression in one pass over the quiz:
+        # Q1-Q3 should be L1/L2, Q8-Q10 should be L3-L5
+        levels: Counter[str] = Counter()
         progression_issues: list[str] = []
 
-        for i, q in enumerate(quiz[:3], start=1):
-            bl = q.get("bloom_level", "").upper().strip()
-            if bl not in ("L1", "L2"):
-                progression_ok = False
-                progression_issues.append(f"Q{i} is {bl}, expected L1 or L2")
-
-        for i, q in enumerate(quiz[7:10], start=8):
+        for i, q in enumerate(quiz, start=1):
             bl = q.get("bloom_level", "").upper().strip()
-            if bl not in ("L3", "L4", "L5"):
-                progression_ok = False
-                progression_issues.append(f"Q{i} is {bl}, expected L3-L5")
+            levels[bl] += 1
+            if i <= 3:
+                if bl not in ("L1", "L2"):
+                    progression_issues.append(f"Q{i} is {bl}, expected L1 or L2")
+            elif 8 <= i <= 10:
+                if bl not in ("L3", "L4", "L5"):
+                    progression_issues.append(f"Q{i} is {bl}, expected L3-L5")
+
+        actual_counts = tuple(levels[level] for level in _BLOOM_LEVELS)
+        actual = dict(zip(_BLOOM_LEVELS, actual_counts))
+        distribution_match = actual_counts == _BLOOM_TUPLES.get(grade, _BLOOM_TUPLES["3"])
+        progression_ok = not progression_issues
 
         details = {
             "expected": expected,
@@ -439,7 +567,7 @@ class LessonValidator:
         activity_type = activity.get("type", "")
 
         # Case-insensitive match
-        allowed_lower = [a.lower() for a in allowed]
+        allowed_lower = _ALLOWED_INTERACTIONS_LOWER.get(grade, _ALLOWED_INTERACTIONS_LOWER["3"])
         is_allowed = activity_type.lower() in allowed_lower
 
         # Check Bloom's level of activity matches expected (L3 Apply or L4 Analyze)
@@ -448,7 +576,7 @@ class LessonValidator:
 
         details = {
             "activity_type": activity_type,
-            "allowed_for_grade": allowed,
+            "allowed_for_grade": list(allowed),
             "is_allowed": is_allowed,
             "activity_bloom_level": activity_bloom,
             "bloom_level_valid": bloom_ok,
@@ -484,6 +612,7 @@ class LessonValidator:
         self,
         lesson_data: dict,
         kb_definitions: Optional[dict[str, str]] = None,
+        scan: Optional[_LessonScan] = None,
         **_kwargs,
     ) -> CheckResult:
         """
@@ -499,16 +628,18 @@ class LessonValidator:
                 message="No KB definitions available; skipping definition alignment.",
             )
 
-        all_text = _extract_all_text(lesson_data).lower()
+        if scan is None:
+            scan = _scan_lesson(lesson_data)
+        found = _find_terms(kb_definitions, scan.all_text_lower)
 
         concepts_checked = 0
         concepts_found = 0
         missing_concepts: list[str] = []
 
-        for concept, definition in kb_definitions.items():
+        for concept in kb_definitions:
             concepts_checked += 1
             # Check if the concept term appears in the lesson text
-            if concept.lower() in all_text:
+            if concept.lower() in found:
                 concepts_found += 1
             else:
                 missing_concepts.append(concept)
@@ -562,20 +693,22 @@ class LessonValidator:
 
         # Extract key terms from narrative (words > 3 chars)
         narrative_terms = [
-            w.lower() for w in re.findall(r'\b\w+\b', context_narrative) if len(w) > 3
+            w.lower() for w in _RE_WORD.findall(context_narrative) if len(w) > 3
         ]
 
-        opening_references = sum(1 for t in narrative_terms if t in opening_text)
+        opening_found = _find_terms(narrative_terms, opening_text)
+        opening_references = sum(1 for t in narrative_terms if t in opening_found)
 
         # Check narrated explanation sections
         explanations = lesson_data.get("narrated_explanation", [])
-        explanation_text = ""
+        explanation_parts: list[str] = []
         if isinstance(explanations, list):
             for exp in explanations:
                 if isinstance(exp, dict):
-                    explanation_text += " " + str(exp.get("teacher_explains", ""))
-        explanation_text = explanation_text.lower()
-        explanation_references = sum(1 for t in narrative_terms if t in explanation_text)
+                    explanation_parts.append(str(exp.get("teacher_explains", "")))
+        explanation_text = " ".join(explanation_parts).lower()
+        explanation_found = _find_terms(narrative_terms, explanation_text)
+        explanation_references = sum(1 for t in narrative_terms if t in explanation_found)
 
         locations: list[str] = []
         if opening_references > 0:
@@ -609,17 +742,23 @@ class LessonValidator:
     # CHECK f) Audio Pacing
     # ------------------------------------------------------------------
 
-    def audio_pacing_check(self, lesson_data: dict, **_kwargs) -> CheckResult:
+    def audio_pacing_check(
+        self,
+        lesson_data: dict,
+        scan: Optional[_LessonScan] = None,
+        **_kwargs,
+    ) -> CheckResult:
         """
         Count [Beat] and [Pause] markers.
         Verify [Pause] present in at least 1 section.
         Check sentence length alternation (short/medium mix).
         """
-        all_text = _extract_all_text(lesson_data)
+        if scan is None:
+            scan = _scan_lesson(lesson_data)
 
-        beat_count = len(re.findall(r'\[Beat\]', all_text))
-        pause_count = len(re.findall(r'\[Pause\]', all_text))
-        emphasis_count = len(re.findall(r'\[Emphasis:\s*\w+\]', all_text))
+        beat_count = scan.beats
+        pause_count = scan.pauses
+        emphasis_count = len(scan.emphasis_words)
 
         has_pause = pause_count >= 1
         has_beats = beat_count >= 1
@@ -673,21 +812,22 @@ class LessonValidator:
         has_hint_3 = bool(activity.get("feedback_reveal", ""))
         activity_hints_ok = has_hint_1 and has_hint_2 and has_hint_3
 
-        # Check quiz feedback
+        # Check quiz feedback; only the first few issues are kept for the report
         quiz_feedback_issues: list[str] = []
+        issues_count = 0
         for i, q in enumerate(quiz, start=1):
-            fc = q.get("feedback_correct", "")
-            fi = q.get("feedback_incorrect", "")
-            if not fc:
-                quiz_feedback_issues.append(f"Q{i}: missing feedback_correct")
-            elif len(fc.split()) < 4:
-                quiz_feedback_issues.append(f"Q{i}: feedback_correct too short (needs reasoning)")
-            if not fi:
-                quiz_feedback_issues.append(f"Q{i}: missing feedback_incorrect")
-            elif len(fi.split()) < 4:
-                quiz_feedback_issues.append(f"Q{i}: feedback_incorrect too short (needs reasoning)")
-
-        quiz_feedback_complete = len(quiz_feedback_issues) == 0
+            for key in ("feedback_correct", "feedback_incorrect"):
+                feedback = q.get(key, "")
+                if feedback and len(feedback.split()) >= 4:
+                    continue
+                issues_count += 1
+                if len(quiz_feedback_issues) < _MAX_REPORTED_ISSUES:
+                    quiz_feedback_issues.append(
+                        f"Q{i}: {key} too short (needs reasoning)" if feedback
+                        else f"Q{i}: missing {key}"
+                    )
+
+        quiz_feedback_complete = issues_count == 0
 
         details = {
             "activity_hint_1": has_hint_1,
@@ -695,7 +835,7 @@ class LessonValidator:
             "activity_hint_3_reveal": has_hint_3,
             "activity_multitier_ok": activity_hints_ok,
             "quiz_feedback_complete": quiz_feedback_complete,
-            "quiz_feedback_issues": quiz_feedback_issues[:5],
+            "quiz_feedback_issues": quiz_feedback_issues,
         }
 
         if not activity_hints_ok:
@@ -729,6 +869,7 @@ class LessonValidator:
         lesson_data: dict,
         exclusions: Optional[list[str]] = None,
         prerequisites: Optional[list[str]] = None,
+        scan: Optional[_LessonScan] = None,
         **_kwargs,
     ) -> CheckResult:
         """
@@ -738,12 +879,13 @@ class LessonValidator:
         exclusions = exclusions or []
         prerequisites = prerequisites or []
 
-        all_text = _extract_all_text(lesson_data).lower()
-
+        # Nothing to look for: skip the lesson scan and lowercasing entirely
         excluded_found: list[str] = []
-        for concept in exclusions:
-            if concept.lower() in all_text:
-                excluded_found.append(concept)
+        if exclusions:
+            if scan is None:
+                scan = _scan_lesson(lesson_data)
+            found = _find_terms(exclusions, scan.all_text_lower)
+            excluded_found = [concept for concept in exclusions if concept.lower() in found]
 
         details = {
             "exclusions_checked": exclusions,
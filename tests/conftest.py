@@ -2,13 +2,18 @@
 
 Environment variables are set at the top of this module *before* any src
 imports so that ``src.database._build_engine()`` does not raise at import
-time during testing.
+time during testing.  ``create_async_engine`` is replaced for the whole
+session at the same point, so whichever test first imports ``src.database``
+gets an inert engine instead of a real connection pool.
 
 Fixture hierarchy
 -----------------
 mock_kb_loader   → MockKBLoader with hardcoded Grade 3 (+ multi-grade) data
-mock_db_session  → Async mock of SQLAlchemy AsyncSession
-sample_topic     → Mock Topic ORM object (Grade 3, EVS, Types of Plants)
+grade_ceiling    → (grade, language ceiling), parametrized over every grade
+grade_blooms     → (grade, Bloom distribution), parametrized over every grade
+grade_interactions → (grade, allowed interactions), parametrized over every grade
+mock_db_session  → Lightweight stub of SQLAlchemy AsyncSession
+sample_topic     → Frozen Topic stand-in (Grade 3, EVS, Types of Plants)
 test_client      → FastAPI TestClient with DB + KB dependencies overridden
 """
 
@@ -26,14 +31,33 @@ os.environ.setdefault(
 )
 os.environ.setdefault("ANTHROPIC_API_KEY", "test_key_not_real")
 os.environ.setdefault("KB_PATH", "/home/kunal/projects/kitmeK-lesson-backend/kb_files")
+# The app lifespan runs for the whole session; don't start an inotify watcher
+os.environ.setdefault("KB_WATCH", "false")
 
-from typing import AsyncGenerator
-from unittest.mock import AsyncMock, MagicMock, patch
+import functools
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 import pytest
+import sqlalchemy.ext.asyncio as _sa_async
 
-from tests.fixtures.mock_kb_files import MockKBLoader
-from tests.fixtures.sample_lessons import VALID_GRADE3_LESSON
+
+class _EngineStub:
+    """Inert engine: sessions bound to it fail, so DB health reports "error"."""
+
+    async def dispose(self) -> None:
+        pass
+
+
+# Swapped once for the session, before anything can import src.database;
+# restored by the _restore_create_async_engine finalizer.  A plain stub
+# keeps unittest.mock out of conftest import.
+_REAL_CREATE_ASYNC_ENGINE = _sa_async.create_async_engine
+_sa_async.create_async_engine = lambda *args, **kwargs: _EngineStub()
+
+if TYPE_CHECKING:
+    from tests.fixtures.mock_kb_files import MockKBLoader
 
 
 # ---------------------------------------------------------------------------
@@ -41,87 +65,233 @@ from tests.fixtures.sample_lessons import VALID_GRADE3_LESSON
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_kb_loader() -> MockKBLoader:
     """Provide a MockKBLoader with hardcoded Grade 3 KB data.
 
     Returns a ``MockKBLoader`` instance whose methods return values sourced
     directly from the KB Markdown files.  Tests should use this instead of
-    hitting the real filesystem or database.
+    hitting the real filesystem or database.  The loader is stateless, so a
+    single instance is shared by the whole session.
     """
+    # Imported here so runs that never request the fixture skip the module
+    from tests.fixtures.mock_kb_files import MockKBLoader
+
     return MockKBLoader()
 
 
+_GRADES = ["K", "1", "2", "3", "4", "5"]
+
+
+@pytest.fixture(scope="session", params=_GRADES)
+def grade_ceiling(
+    request: pytest.FixtureRequest, mock_kb_loader: MockKBLoader
+) -> tuple[str, Mapping[str, Any]]:
+    """Provide ``(grade, language ceiling)`` for each grade in turn.
+
+    Session-scoped, so each grade's value is built once for the whole run
+    and shared by every test that requests this fixture.
+    """
+    return request.param, mock_kb_loader.get_language_ceiling(request.param)
+
+
+@pytest.fixture(scope="session", params=_GRADES)
+def grade_blooms(
+    request: pytest.FixtureRequest, mock_kb_loader: MockKBLoader
+) -> tuple[str, Mapping[str, int]]:
+    """Provide ``(grade, Bloom distribution)`` for each grade in turn."""
+    return request.param, mock_kb_loader.get_bloom_distribution(request.param)
+
+
+@pytest.fixture(scope="session", params=_GRADES)
+def grade_interactions(
+    request: pytest.FixtureRequest, mock_kb_loader: MockKBLoader
+) -> tuple[str, list[str]]:
+    """Provide ``(grade, allowed interactions)`` for each grade in turn."""
+    return request.param, mock_kb_loader.get_allowed_interactions(request.param)
+
+
 # ---------------------------------------------------------------------------
 # Async DB session mock
 # ---------------------------------------------------------------------------
 
 
+class _ResultStub:
+    """Empty stand-in for a SQLAlchemy ``Result`` / ``ScalarResult``.
+
+    Every accessor reports "no rows", and ``scalars()`` returns the stub
+    itself, so chains like ``.scalars().first()`` allocate nothing.
+    """
+
+    def scalars(self) -> _ResultStub:
+        return self
+
+    def scalar(self) -> None:
+        return None
+
+    def scalar_one(self) -> None:
+        return None
+
+    def scalar_one_or_none(self) -> None:
+        return None
+
+    def first(self) -> None:
+        return None
+
+    def one(self) -> None:
+        return None
+
+    def one_or_none(self) -> None:
+        return None
+
+    def all(self) -> list[Any]:
+        return []
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(())
+
+
+# Shared result for unconfigured execute()/scalars() calls
+_RESULT_STUB = _ResultStub()
+
+
+class _StubAsyncSession:
+    """Lightweight stand-in for SQLAlchemy ``AsyncSession``.
+
+    Every common session method is a no-op coroutine (``add`` is sync), so
+    building one is far cheaper than wiring up an ``AsyncMock``.  Tests
+    replace individual methods with ``AsyncMock`` objects when they need
+    canned results or call assertions.
+    """
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        return _RESULT_STUB
+
+    async def scalars(self, *args: Any, **kwargs: Any) -> Any:
+        return _RESULT_STUB
+
+    async def scalar(self, *args: Any, **kwargs: Any) -> Any:
+        return None
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        return None
+
+    def add(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    async def flush(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    async def refresh(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> _StubAsyncSession:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> bool:
+        return False
+
+
 @pytest.fixture
-async def mock_db_session() -> AsyncGenerator[AsyncMock, None]:
-    """Provide an async mock of SQLAlchemy ``AsyncSession``.
+def mock_db_session() -> _StubAsyncSession:
+    """Provide a stub of SQLAlchemy ``AsyncSession``.
 
-    Yields an ``AsyncMock`` with all common session methods (execute, commit,
-    rollback, close, add, flush) pre-configured.  The mock does not interact
-    with any database.
+    Returns a fresh :class:`_StubAsyncSession` whose common methods (execute,
+    commit, rollback, close, add, flush, get) are no-ops.  The stub does not
+    interact with any database.  Tests reconfigure its methods, so it is
+    built per test; it needs no teardown, so it is returned, not yielded.
     """
-    session = AsyncMock()
-    session.execute = AsyncMock(return_value=MagicMock())
-    session.commit = AsyncMock(return_value=None)
-    session.rollback = AsyncMock(return_value=None)
-    session.close = AsyncMock(return_value=None)
-    session.add = MagicMock(return_value=None)
-    session.flush = AsyncMock(return_value=None)
-    session.refresh = AsyncMock(return_value=None)
-    session.scalar = AsyncMock(return_value=None)
-    session.scalars = AsyncMock(return_value=MagicMock())
-    # Support async context-manager usage: ``async with session`` (__aenter__/__aexit__)
-    session.__aenter__ = AsyncMock(return_value=session)
-    session.__aexit__ = AsyncMock(return_value=False)
-    yield session
+    return _StubAsyncSession()
 
 
 # ---------------------------------------------------------------------------
-# Sample Topic ORM mock
+# Sample Topic ORM stand-in
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def sample_topic() -> MagicMock:
-    """Provide a mock Topic ORM object representing Grade 3, EVS, Types of Plants.
+@dataclass(frozen=True)
+class _GradeStub:
+    grade_code: str
+
+
+@dataclass(frozen=True)
+class _SubjectStub:
+    subject_name: str
+    grade: _GradeStub
+
+
+@dataclass(frozen=True)
+class _ChapterStub:
+    id: int
+    chapter_name: str
+    chapter_number: int
+    subject: _SubjectStub
+
+
+@dataclass(frozen=True)
+class _TopicStub:
+    """Immutable, picklable stand-in for the ``Topic`` ORM model."""
+
+    id: int
+    topic_number: int
+    topic_name: str
+    topic_description: str
+    sequence_number: int
+    # JSON strings as stored in the DB column (see Topic ORM model)
+    prerequisites: str
+    exclusions: str
+    context_narrative: str
+    chapter_id: int
+    chapter: _ChapterStub
+
+
+_SAMPLE_TOPIC = _TopicStub(
+    id=42,
+    topic_number=1,
+    topic_name="Trees vs Shrubs",
+    topic_description="Differences between trees and shrubs based on stem structure.",
+    sequence_number=1,
+    prerequisites="[]",
+    exclusions='["climbers", "creepers"]',
+    context_narrative=(
+        "Meera and her grandfather were walking in the park when they spotted "
+        "a tall mango tree next to a short rose bush."
+    ),
+    chapter_id=10,
+    chapter=_ChapterStub(
+        id=10,
+        chapter_name="Types of Plants",
+        chapter_number=1,
+        subject=_SubjectStub(subject_name="EVS", grade=_GradeStub(grade_code="3")),
+    ),
+)
+
+
+@pytest.fixture(scope="session")
+def sample_topic() -> _TopicStub:
+    """Provide a Topic stand-in representing Grade 3, EVS, Types of Plants.
 
     The fixture mirrors the Topic model defined in ``src/models/topic.py`` and
     the curriculum row from Appendix B of the architecture document:
         grade=3, subject=EVS, chapter="Types of Plants", topic="Trees vs Shrubs"
 
+    The ``topic → chapter → subject → grade`` chain is built from frozen
+    dataclasses, so the shared instance cannot be mutated by a test and
+    pickles cleanly into pytest-xdist workers.
+
     Returns:
-        A ``MagicMock`` with all Topic fields populated with realistic values.
+        A ``_TopicStub`` with all Topic fields populated with realistic values.
     """
-    topic = MagicMock()
-    topic.id = 42
-    topic.topic_number = 1
-    topic.topic_name = "Trees vs Shrubs"
-    topic.topic_description = "Differences between trees and shrubs based on stem structure."
-    topic.sequence_number = 1
-    # JSON strings as stored in the DB column (see Topic ORM model)
-    topic.prerequisites = "[]"
-    topic.exclusions = '["climbers", "creepers"]'
-    topic.context_narrative = (
-        "Meera and her grandfather were walking in the park when they spotted "
-        "a tall mango tree next to a short rose bush."
-    )
-    topic.chapter_id = 10
-    # Related chapter mock
-    topic.chapter = MagicMock()
-    topic.chapter.id = 10
-    topic.chapter.chapter_name = "Types of Plants"
-    topic.chapter.chapter_number = 1
-    # Related grade mock (via chapter → subject → grade chain)
-    topic.chapter.subject = MagicMock()
-    topic.chapter.subject.grade = MagicMock()
-    topic.chapter.subject.grade.grade_code = "3"
-    topic.chapter.subject.subject_name = "EVS"
-    return topic
+    return _SAMPLE_TOPIC
 
 
 # ---------------------------------------------------------------------------
@@ -129,39 +299,87 @@ def sample_topic() -> MagicMock:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def test_client(mock_db_session: AsyncMock, mock_kb_loader: MockKBLoader):
-    """Provide a FastAPI TestClient with DB and KB dependencies overridden.
+@functools.lru_cache(maxsize=1)
+def _get_app_and_deps() -> tuple[Any, Any, Any]:
+    """Import the FastAPI app and the dependencies tests override, once.
 
-    The ``get_async_db`` FastAPI dependency is replaced with one that yields
-    *mock_db_session*.  If the application exposes a KB loader dependency it
-    is replaced with *mock_kb_loader*.  The overrides are cleared after the
-    test completes.
+    The import is deferred so unit-only runs never load the app; the engine
+    stub is already in place by the time it happens.
+
+    Returns:
+        ``(app, get_async_db, get_kb_loader)``.
+    """
+    from src.main import app
+    from src.database import get_async_db
+    from src.api.dependencies import get_kb_loader
+
+    return app, get_async_db, get_kb_loader
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _restore_create_async_engine(request: pytest.FixtureRequest) -> None:
+    """Put the real ``create_async_engine`` back when the test session ends."""
+
+    def _restore() -> None:
+        _sa_async.create_async_engine = _REAL_CREATE_ASYNC_ENGINE
+
+    request.addfinalizer(_restore)
+
+
+@pytest.fixture(scope="session")
+def _app_client():
+    """Start the FastAPI app once and share its ``TestClient`` for the session.
+
+    Entering the client runs the app lifespan (KB load, DB probe); doing it
+    once saves a full startup/shutdown cycle per test.
 
     Yields:
-        A ``starlette.testclient.TestClient`` bound to the FastAPI app.
+        ``(app, client)``.
     """
     from fastapi.testclient import TestClient
 
-    # Patch the database engine creation so importing src.database doesn't
-    # attempt a real DB connection during TestClient startup.
-    with patch("sqlalchemy.ext.asyncio.create_async_engine") as _mock_engine:
-        _mock_engine.return_value = MagicMock()
+    app, _, _ = _get_app_and_deps()
+    with TestClient(app) as client:
+        yield app, client
+
+
+class _DbOverride:
+    """``get_async_db`` override that returns a fixed session.
+
+    ``__call__`` is a plain coroutine, which FastAPI awaits inline; generator
+    dependencies get context-manager wrapping (sync ones also a threadpool
+    hop each way) and the stub session needs no teardown.
+    """
+
+    __slots__ = ("session",)
+
+    def __init__(self, session: _StubAsyncSession) -> None:
+        self.session = session
 
-        from src.main import app
-        from src.database import get_async_db
+    async def __call__(self) -> _StubAsyncSession:
+        return self.session
+
+
+@pytest.fixture
+def test_client(
+    _app_client, mock_db_session: _StubAsyncSession, mock_kb_loader: MockKBLoader
+):
+    """Provide a FastAPI TestClient with DB and KB dependencies overridden.
 
-        async def _override_get_db() -> AsyncGenerator[AsyncMock, None]:
-            """Dependency override that yields the mock DB session."""
-            yield mock_db_session
+    The ``get_async_db`` FastAPI dependency is replaced with one that returns
+    *mock_db_session*.  If the application exposes a KB loader dependency it
+    is replaced with *mock_kb_loader*.  The overrides are cleared after the
+    test completes; the client itself is shared across the session.
 
-        app.dependency_overrides[get_async_db] = _override_get_db
+    Yields:
+        A ``starlette.testclient.TestClient`` bound to the FastAPI app.
+    """
+    app, client = _app_client
+    _, get_async_db, get_kb_loader = _get_app_and_deps()
 
-        # Override KB loader dependency from src.api.dependencies
-        from src.api.dependencies import get_kb_loader
-        app.dependency_overrides[get_kb_loader] = lambda: mock_kb_loader
+    app.dependency_overrides[get_async_db] = _DbOverride(mock_db_session)
+    app.dependency_overrides[get_kb_loader] = lambda: mock_kb_loader
 
-        with TestClient(app) as client:
-            yield client
+    yield client
 
-        app.dependency_overrides.clear()
+    app.dependency_overrides.clear()
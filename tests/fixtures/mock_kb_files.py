@@ -12,7 +12,9 @@ Grade 3 constraints are taken directly from:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
 
@@ -29,13 +31,17 @@ _LANGUAGE_CEILINGS: dict[str, dict[str, Any]] = {
     "5": {"max_sentence_length": 18, "new_vocab": 10},
 }
 
-_BLOOM_DISTRIBUTIONS: dict[str, dict[str, int]] = {
-    "K": {"L1": 6, "L2": 2, "L3": 1, "L4": 0, "L5": 0},
-    "1": {"L1": 5, "L2": 3, "L3": 2, "L4": 0, "L5": 0},
-    "2": {"L1": 4, "L2": 3, "L3": 2, "L4": 1, "L5": 0},
-    "3": {"L1": 2, "L2": 3, "L3": 3, "L4": 1, "L5": 1},
-    "4": {"L1": 1, "L2": 2, "L3": 3, "L4": 2, "L5": 2},
-    "5": {"L1": 1, "L2": 1, "L3": 3, "L4": 3, "L5": 2},
+_BLOOM_KEYS = ("L1", "L2", "L3", "L4", "L5")
+
+# Question counts per Bloom level, in _BLOOM_KEYS order
+# (NCERT_Pedagogical_Style_Knowledge.md, "Exact distribution per grade")
+_BLOOM_TUPLES: dict[str, tuple[int, int, int, int, int]] = {
+    "K": (4, 4, 2, 0, 0),
+    "1": (3, 4, 2, 1, 0),
+    "2": (3, 3, 2, 1, 1),
+    "3": (2, 3, 3, 1, 1),
+    "4": (2, 2, 3, 2, 1),
+    "5": (1, 2, 3, 2, 2),
 }
 
 # Grade 3 allowed interactions per digital_interactions.md (Grade 3 section)
@@ -90,41 +96,71 @@ _ALLOWED_INTERACTIONS: dict[str, list[str]] = {
     ],
 }
 
+# Read-only views handed out by the getters, so no per-call copy is needed
+_LANGUAGE_CEILINGS_RO: dict[str, Mapping[str, Any]] = {
+    grade: MappingProxyType(ceiling) for grade, ceiling in _LANGUAGE_CEILINGS.items()
+}
+_BLOOM_DISTRIBUTIONS_RO: dict[str, Mapping[str, int]] = {
+    grade: MappingProxyType(dict(zip(_BLOOM_KEYS, counts)))
+    for grade, counts in _BLOOM_TUPLES.items()
+}
+
+# Membership sets for is_interaction_allowed
+_ALLOWED_INTERACTIONS_SET: dict[str, frozenset[str]] = {
+    grade: frozenset(names) for grade, names in _ALLOWED_INTERACTIONS.items()
+}
+
 _VALID_GRADES = frozenset({"K", "1", "2", "3", "4", "5"})
+# Pre-sorted for the unknown-grade error message
+_SORTED_VALID_GRADES = sorted(_VALID_GRADES)
 _KB_VERSION = "1.0-test"
 
+_KB_FILES: tuple[str, ...] = (
+    "NCERT_Pedagogical_Style_Knowledge.md",
+    "language_guidelines.md",
+    "digital_interactions.md",
+    "question_bank.md",
+    "definitions_and_examples.md",
+)
+
+_DEFAULT_RAW_CONTENT: Mapping[str, str] = MappingProxyType({
+    "NCERT_Pedagogical_Style_Knowledge.md": "# Pedagogical Style\n## Grade 3\n...",
+    "language_guidelines.md": "# Language Guidelines\n## Grade 3\n...",
+    "digital_interactions.md": "# Digital Interactions\n## Grade 3\n...",
+    "question_bank.md": "# Question Bank\n...",
+    "definitions_and_examples.md": "# Definitions and Examples\n...",
+})
+
 
 # ---------------------------------------------------------------------------
 # MockKBData
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True)
 class MockKBData:
-    """Mock KB data object for testing (mimics real KBData)."""
+    """Mock KB data object for testing (mimics real KBData).
+
+    Frozen, with read-only defaults, so one instance is shared by every
+    :meth:`MockKBLoader.load` / :meth:`MockKBLoader.reload` call.
+    """
 
     version: str = _KB_VERSION
     checksum: str = "mock-checksum-1234567890abcdef"
-    files_loaded: list[str] = None
-    raw_content: dict[str, str] = None
-
-    def __post_init__(self) -> None:
-        if self.files_loaded is None:
-            self.files_loaded = [
-                "NCERT_Pedagogical_Style_Knowledge.md",
-                "language_guidelines.md",
-                "digital_interactions.md",
-                "question_bank.md",
-                "definitions_and_examples.md",
-            ]
-        if self.raw_content is None:
-            self.raw_content = {
-                "NCERT_Pedagogical_Style_Knowledge.md": "# Pedagogical Style\n## Grade 3\n...",
-                "language_guidelines.md": "# Language Guidelines\n## Grade 3\n...",
-                "digital_interactions.md": "# Digital Interactions\n## Grade 3\n...",
-                "question_bank.md": "# Question Bank\n...",
-                "definitions_and_examples.md": "# Definitions and Examples\n...",
-            }
+    files_loaded: tuple[str, ...] = _KB_FILES
+    # dataclasses rejects unhashable defaults, so hand the shared proxy out via a factory
+    raw_content: Mapping[str, str] = field(default_factory=lambda: _DEFAULT_RAW_CONTENT)
+
+
+_MOCK_KB_DATA = MockKBData()
+
+
+def _for_grade(table: Mapping[str, Any], grade: str) -> Any:
+    """Return ``table[grade]`` in a single lookup, or raise for an unknown grade."""
+    value = table.get(grade)
+    if value is None:
+        raise ValueError(f"Unknown grade '{grade}'. Valid grades: {_SORTED_VALID_GRADES}")
+    return value
 
 
 # ---------------------------------------------------------------------------
@@ -143,27 +179,34 @@ class MockKBLoader:
         """Load the KB (mocked for testing).
 
         Returns:
-            MockKBData object with KB metadata.
+            The shared MockKBData object with KB metadata.
+        """
+        return _MOCK_KB_DATA
+
+    async def aload(self) -> MockKBData:
+        """Async variant of :meth:`load` (mocked for testing).
+
+        Returns:
+            The shared MockKBData object with KB metadata.
         """
-        return MockKBData()
+        return self.load()
 
-    def get_language_ceiling(self, grade: str) -> dict[str, Any]:
+    def get_language_ceiling(self, grade: str) -> Mapping[str, Any]:
         """Return maximum sentence length and new-vocabulary cap for *grade*.
 
         Args:
             grade: Grade code string — one of 'K', '1', '2', '3', '4', '5'.
 
         Returns:
-            Dict with keys ``max_sentence_length`` (int) and ``new_vocab`` (int).
+            Read-only mapping with keys ``max_sentence_length`` (int) and
+            ``new_vocab`` (int).
 
         Raises:
             ValueError: If *grade* is not a recognised grade code.
         """
-        if grade not in _VALID_GRADES:
-            raise ValueError(f"Unknown grade '{grade}'. Valid grades: {sorted(_VALID_GRADES)}")
-        return dict(_LANGUAGE_CEILINGS[grade])
+        return _for_grade(_LANGUAGE_CEILINGS_RO, grade)
 
-    def get_bloom_distribution(self, grade: str) -> dict[str, int]:
+    def get_bloom_distribution(self, grade: str) -> Mapping[str, int]:
         """Return required Bloom's level distribution for the Quick Quiz.
 
         The distribution governs how many questions at each Bloom's level
@@ -173,14 +216,12 @@ class MockKBLoader:
             grade: Grade code string.
 
         Returns:
-            Dict mapping ``'L1'``–``'L5'`` to required question counts.
+            Read-only mapping of ``'L1'``–``'L5'`` to required question counts.
 
         Raises:
             ValueError: If *grade* is not a recognised grade code.
         """
-        if grade not in _VALID_GRADES:
-            raise ValueError(f"Unknown grade '{grade}'. Valid grades: {sorted(_VALID_GRADES)}")
-        return dict(_BLOOM_DISTRIBUTIONS[grade])
+        return _for_grade(_BLOOM_DISTRIBUTIONS_RO, grade)
 
     def get_allowed_interactions(self, grade: str) -> list[str]:
         """Return the list of interaction type names permitted for *grade*.
@@ -198,9 +239,7 @@ class MockKBLoader:
         Raises:
             ValueError: If *grade* is not a recognised grade code.
         """
-        if grade not in _VALID_GRADES:
-            raise ValueError(f"Unknown grade '{grade}'. Valid grades: {sorted(_VALID_GRADES)}")
-        return list(_ALLOWED_INTERACTIONS[grade])
+        return list(_for_grade(_ALLOWED_INTERACTIONS, grade))
 
     def get_kb_version(self) -> dict[str, Any]:
         """Return version metadata for the KB.
@@ -211,22 +250,17 @@ class MockKBLoader:
         return {
             "kb_version": _KB_VERSION,
             "checksum": "test-checksum-mock",
-            "files_loaded": [
-                "NCERT_Pedagogical_Style_Knowledge.md",
-                "language_guidelines.md",
-                "digital_interactions.md",
-                "question_bank.md",
-                "definitions_and_examples.md",
-            ],
+            # A list, like the real KBLoader.get_kb_version
+            "files_loaded": list(_KB_FILES),
         }
 
     def reload(self) -> MockKBData:
         """Reload the KB from source files (mocked for testing).
 
         Returns:
-            MockKBData object with version, checksum, and files_loaded.
+            The shared MockKBData object with version, checksum, and files_loaded.
         """
-        return MockKBData()
+        return _MOCK_KB_DATA
 
     def is_interaction_allowed(self, interaction_type: str, grade: str) -> bool:
         """Convenience check: return True iff *interaction_type* is allowed for *grade*.
@@ -237,5 +271,8 @@ class MockKBLoader:
 
         Returns:
             ``True`` if allowed, ``False`` otherwise.
+
+        Raises:
+            ValueError: If *grade* is not a recognised grade code.
         """
-        return interaction_type in self.get_allowed_interactions(grade)
+        return interaction_type in _for_grade(_ALLOWED_INTERACTIONS_SET, grade)
@@ -22,6 +22,9 @@ Language ceiling Grade 3: max 12 words per sentence, ≤ 6 new vocab words.
 
 from __future__ import annotations
 
+import copy
+import functools
+
 # ---------------------------------------------------------------------------
 # VALID_GRADE3_LESSON — passes ALL 8 validation checks
 # ---------------------------------------------------------------------------
@@ -226,14 +229,23 @@ VALID_GRADE3_LESSON: dict = {
 
 
 # ---------------------------------------------------------------------------
-# INVALID_LESSON_LONG_SENTENCES — fails language_ceiling check
+# Invalid lesson factories
+#
+# Each factory returns a fresh deep copy of VALID_GRADE3_LESSON with one
+# section replaced, so a test may mutate its lesson without affecting others.
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# make_invalid_long_sentences — fails language_ceiling check
 # ---------------------------------------------------------------------------
 
-INVALID_LESSON_LONG_SENTENCES: dict = {
-    **VALID_GRADE3_LESSON,
+
+def make_invalid_long_sentences() -> dict:
+    """Return a lesson whose narrated explanation breaks the Grade 3 ceiling."""
+    lesson = copy.deepcopy(VALID_GRADE3_LESSON)
     # Override narrated explanation with one sentence that has 25 words —
     # far exceeding Grade 3's ceiling of 12 words.
-    "narrated_explanation": [
+    lesson["narrated_explanation"] = [
         {
             "concept_name": "Trees.",
             "teacher_explains": (
@@ -246,42 +258,52 @@ INVALID_LESSON_LONG_SENTENCES: dict = {
             "on_screen": {},
             "transition": "Now look at shrubs.",
         },
-    ],
-}
+    ]
+    return lesson
 
 
 # ---------------------------------------------------------------------------
-# INVALID_LESSON_WRONG_BLOOMS — fails blooms_distribution check
+# make_invalid_wrong_blooms — fails blooms_distribution check
 # ---------------------------------------------------------------------------
 
-# All 10 quiz questions tagged L1 — but Grade 3 requires L1×2, L2×3, L3×3, L4×1, L5×1
-_wrong_blooms_quiz = [
-    {
-        "question_number": i + 1,
-        "type": "MCQ.",
-        "bloom_level": "L1",  # All L1 — wrong distribution for Grade 3
-        "prompt": f"Question {i + 1}?",
-        "options": ["A", "B"],
-        "answer": "A.",
-        "feedback_correct": "Well done, that is correct.",
-        "feedback_incorrect": "Not quite, try again please.",
-    }
-    for i in range(10)
-]
 
-INVALID_LESSON_WRONG_BLOOMS: dict = {
-    **VALID_GRADE3_LESSON,
-    "quick_quiz": _wrong_blooms_quiz,
-}
+@functools.cache
+def _wrong_blooms_quiz() -> list[dict]:
+    """All 10 quiz questions tagged L1 — Grade 3 needs L1×2, L2×3, L3×3, L4×1, L5×1.
+
+    Built on first use and shared; callers must deep-copy before handing it out.
+    """
+    return [
+        {
+            "question_number": i + 1,
+            "type": "MCQ.",
+            "bloom_level": "L1",  # All L1 — wrong distribution for Grade 3
+            "prompt": f"Question {i + 1}?",
+            "options": ["A", "B"],
+            "answer": "A.",
+            "feedback_correct": "Well done, that is correct.",
+            "feedback_incorrect": "Not quite, try again please.",
+        }
+        for i in range(10)
+    ]
+
+
+def make_invalid_wrong_blooms() -> dict:
+    """Return a lesson whose quiz is all L1, breaking Grade 3's distribution."""
+    lesson = copy.deepcopy(VALID_GRADE3_LESSON)
+    lesson["quick_quiz"] = copy.deepcopy(_wrong_blooms_quiz())
+    return lesson
 
 
 # ---------------------------------------------------------------------------
-# INVALID_LESSON_BAD_INTERACTION — fails interaction_type check
+# make_invalid_bad_interaction — fails interaction_type check
 # ---------------------------------------------------------------------------
 
-INVALID_LESSON_BAD_INTERACTION: dict = {
-    **VALID_GRADE3_LESSON,
-    "interactive_activity": {
+
+def make_invalid_bad_interaction() -> dict:
+    """Return a lesson whose activity type is not allowed for Grade 3."""
+    lesson = copy.deepcopy(VALID_GRADE3_LESSON)
+    lesson["interactive_activity"] = {
         # "Scratch to reveal" is only allowed for Grade K, NOT Grade 3
         "type": "Scratch to reveal",
         "bloom_level": "L3",
@@ -290,28 +312,37 @@ INVALID_LESSON_BAD_INTERACTION: dict = {
         "feedback_hint_1": "Try scratching gently.",
         "feedback_hint_2": "Keep going, almost there!",
         "feedback_reveal": "The answer is: it is a tree.",
-    },
-}
+    }
+    return lesson
 
 
 # ---------------------------------------------------------------------------
-# INVALID_LESSON_MISSING_FEEDBACK — fails feedback_structure check
+# make_invalid_missing_feedback — fails feedback_structure check
 # ---------------------------------------------------------------------------
 
-_quiz_no_feedback = [
-    {
-        "question_number": i + 1,
-        "type": "MCQ.",
-        "bloom_level": q["bloom_level"],
-        "prompt": q["prompt"],
-        "options": q.get("options", ["A", "B"]),
-        "answer": q["answer"],
-        # Deliberately omitting feedback_correct and feedback_incorrect
-    }
-    for i, q in enumerate(VALID_GRADE3_LESSON["quick_quiz"])
-]
 
-INVALID_LESSON_MISSING_FEEDBACK: dict = {
-    **VALID_GRADE3_LESSON,
-    "quick_quiz": _quiz_no_feedback,
-}
+@functools.cache
+def _quiz_no_feedback() -> list[dict]:
+    """The valid Grade 3 quiz with every feedback field stripped.
+
+    Built on first use and shared; callers must deep-copy before handing it out.
+    """
+    return [
+        {
+            "question_number": i + 1,
+            "type": "MCQ.",
+            "bloom_level": q["bloom_level"],
+            "prompt": q["prompt"],
+            "options": q.get("options", ["A", "B"]),
+            "answer": q["answer"],
+            # Deliberately omitting feedback_correct and feedback_incorrect
+        }
+        for i, q in enumerate(VALID_GRADE3_LESSON["quick_quiz"])
+    ]
+
+
+def make_invalid_missing_feedback() -> dict:
+    """Return a lesson whose quiz questions carry no feedback at all."""
+    lesson = copy.deepcopy(VALID_GRADE3_LESSON)
+    lesson["quick_quiz"] = copy.deepcopy(_quiz_no_feedback())
+    return lesson
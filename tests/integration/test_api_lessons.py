@@ -53,24 +53,8 @@ def test_health_check_returns_ok(test_client):
     )
 
 
-# ---------------------------------------------------------------------------
-# Test 2a: Generate lesson — topic found, orchestrator mocked to return lesson
-# ---------------------------------------------------------------------------
-
-
-def test_generate_lesson_with_valid_topic_calls_pipeline(test_client, mock_db_session):
-    """POST /lessons/generate with a found topic proceeds through the pipeline.
-
-    When the DB returns a valid Topic, the endpoint:
-    1. Fetches Chapter/Subject/Grade context
-    2. Creates a GenerationRequest (status='processing')
-    3. Calls the orchestrator
-
-    We mock the orchestrator to return VALID_GRADE3_LESSON and verify the full
-    pipeline produces a 200 with request_id, status, and validation_report.
-    """
-    from tests.fixtures.sample_lessons import VALID_GRADE3_LESSON
-
+def _mock_topic_lookup(mock_db_session) -> None:
+    """Make *mock_db_session* resolve topic 1 (Grade 3 EVS) and its context rows."""
     # Mock a topic with all required fields
     mock_topic = MagicMock()
     mock_topic.id = 1
@@ -121,6 +105,27 @@ def test_generate_lesson_with_valid_topic_calls_pipeline(test_client, mock_db_se
     )
     mock_db_session.flush = AsyncMock(return_value=None)
 
+
+# ---------------------------------------------------------------------------
+# Test 2a: Generate lesson — topic found, orchestrator mocked to return lesson
+# ---------------------------------------------------------------------------
+
+
+def test_generate_lesson_with_valid_topic_calls_pipeline(test_client, mock_db_session):
+    """POST /lessons/generate with a found topic proceeds through the pipeline.
+
+    When the DB returns a valid Topic, the endpoint:
+    1. Fetches Chapter/Subject/Grade context
+    2. Creates a GenerationRequest (status='processing')
+    3. Calls the orchestrator
+
+    We mock the orchestrator to return VALID_GRADE3_LESSON and verify the full
+    pipeline produces a 200 with request_id, status, and validation_report.
+    """
+    from tests.fixtures.sample_lessons import VALID_GRADE3_LESSON
+
+    _mock_topic_lookup(mock_db_session)
+
     # Patch _call_orchestrator to return VALID_GRADE3_LESSON without Claude API call
     async def _mock_orchestrator(*args, **kwargs):
         return VALID_GRADE3_LESSON
@@ -141,6 +146,33 @@ def test_generate_lesson_with_valid_topic_calls_pipeline(test_client, mock_db_se
     assert "validation_report" in data, f"Response must include 'validation_report', got: {data}"
 
 
+# ---------------------------------------------------------------------------
+# Test 2b: Generate lesson — open Claude circuit returns 503 with Retry-After
+# ---------------------------------------------------------------------------
+
+
+def test_generate_lesson_circuit_open_returns_503_with_retry_after(test_client, mock_db_session):
+    """A fail-fast CircuitOpenError must reach the client as 503, not a generic 500."""
+    from src.exceptions import CircuitOpenError
+
+    _mock_topic_lookup(mock_db_session)
+
+    with patch(
+        "src.api.lessons._call_orchestrator",
+        side_effect=CircuitOpenError("Claude API circuit is open", retry_after=12.3),
+    ):
+        response = test_client.post(
+            "/lessons/generate",
+            json={"topic_id": 1, "kb_version": None},
+        )
+
+    assert response.status_code == 503, (
+        f"Expected 503 while the circuit is open, got {response.status_code}: {response.text}"
+    )
+    assert response.headers["Retry-After"] == "13"
+    assert response.json()["error"] == "claude_unavailable"
+
+
 # ---------------------------------------------------------------------------
 # Test 2: Generate lesson with valid topic_id
 # ---------------------------------------------------------------------------
@@ -0,0 +1,101 @@
+"""Unit tests for the Claude circuit breaker (src/services/circuit_breaker.py).
+
+Tests cover:
+1. Opening — consecutive counted failures open the circuit; calls then fail fast
+2. Uncounted errors — exceptions rejected by ``is_failure`` reset the count
+3. Half-open probe — after the reset timeout one probe runs; success closes
+4. Failed probe — re-opens the circuit for another full timeout
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.exceptions import CircuitOpenError, LessonGenerationError
+from src.services.circuit_breaker import CircuitBreaker
+
+_RESET = 0.05
+
+
+class _Outage(Exception):
+    pass
+
+
+async def _fail() -> None:
+    raise _Outage("upstream down")
+
+
+async def _ok() -> str:
+    return "ok"
+
+
+async def _trip(breaker: CircuitBreaker, times: int) -> None:
+    for _ in range(times):
+        with pytest.raises(_Outage):
+            await breaker.call(_fail)
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_threshold_and_fails_fast():
+    """After failure_threshold failures, calls raise without running the factory."""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60.0)
+    await _trip(breaker, 3)
+    assert breaker.state == "open"
+
+    calls = []
+
+    async def factory() -> str:
+        calls.append(1)
+        return "ok"
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        await breaker.call(factory)
+
+    assert not calls, "An open circuit must not call the upstream"
+    assert isinstance(exc_info.value, LessonGenerationError)
+    assert 0 < exc_info.value.retry_after <= 60.0
+
+
+@pytest.mark.asyncio
+async def test_uncounted_errors_reset_failure_count():
+    """Errors that is_failure rejects prove the upstream answered."""
+    breaker = CircuitBreaker(
+        failure_threshold=2, reset_timeout=60.0, is_failure=lambda exc: isinstance(exc, _Outage)
+    )
+
+    async def bad_output() -> None:
+        raise ValueError("unparseable")
+
+    await _trip(breaker, 1)
+    with pytest.raises(ValueError):
+        await breaker.call(bad_output)
+    await _trip(breaker, 1)
+
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_successful_probe_closes_circuit():
+    """Once reset_timeout passes, a successful probe closes the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=_RESET)
+    await _trip(breaker, 1)
+    await asyncio.sleep(_RESET * 1.5)
+
+    assert await breaker.call(_ok) == "ok"
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_reopens_circuit():
+    """A failing probe re-opens the circuit for another reset_timeout."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=_RESET)
+    await _trip(breaker, 1)
+    await asyncio.sleep(_RESET * 1.5)
+
+    await _trip(breaker, 1)
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(_ok)
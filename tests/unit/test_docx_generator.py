@@ -6,6 +6,8 @@ Tests verify:
 2. The bytes can be parsed as a valid python-docx Document.
 3. The DOCX contains the lesson topic name.
 4. The DOCX includes a validation-report appendix when one is supplied.
+5. generate_async() returns the same document and can write it to disk.
+6. Empty content fields are skipped, but a numeric quiz answer of 0 is kept.
 
 No database or Claude API calls are made.
 """
@@ -160,3 +162,90 @@ def test_docx_includes_validation_appendix_when_provided(generator):
         "DOCX must include an 'APPENDIX: Validation Report' section when a "
         f"validation_report is supplied. Document text preview:\n{full_text[:400]}"
     )
+
+
+# ---------------------------------------------------------------------------
+# Test 5: generate_async() returns DOCX bytes and writes out_path
+# ---------------------------------------------------------------------------
+
+
+async def test_generate_async_returns_bytes_and_writes_file(generator, tmp_path):
+    """generate_async runs generation off the event loop and persists on request.
+
+    The returned bytes must be a DOCX (ZIP magic) and, when ``out_path`` is
+    given, the file on disk must contain exactly the returned bytes.
+    """
+    out_file = tmp_path / "lesson.docx"
+
+    result = await generator.generate_async(
+        lesson_data=VALID_GRADE3_LESSON,
+        grade="3",
+        subject="EVS",
+        topic_name=_TOPIC_NAME,
+        chapter_name=_CHAPTER_NAME,
+        out_path=str(out_file),
+    )
+
+    assert result[:2] == b"PK", "generate_async must return DOCX (ZIP) bytes"
+    assert out_file.read_bytes() == result, (
+        "The file written to out_path must match the returned bytes"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Test 6: empty fields are skipped, a 0 answer is not
+# ---------------------------------------------------------------------------
+
+
+def test_generate_skips_empty_fields_but_keeps_zero_answer(generator):
+    """Blank on-screen fields must not produce empty "Label: " lines.
+
+    Quiz answers are the exception to the truthiness guard: a numeric
+    answer of 0 is meaningful and must still be rendered.
+    """
+    from docx import Document
+
+    lesson = {
+        "on_screen_opening": {"layout": "", "static_elements": [], "animation": "fade"},
+        "quick_quiz": [{"question_number": 1, "prompt": "3 - 3 = ?", "answer": 0}],
+    }
+    doc = Document(io.BytesIO(generator.generate(lesson_data=lesson)))
+    texts = [p.text for p in doc.paragraphs]
+
+    assert "Animation: fade" in texts
+    assert not any(t.startswith(("Layout:", "Static Elements:")) for t in texts), (
+        "Empty on-screen fields must be skipped"
+    )
+    assert "Answer: 0" in texts, "A numeric answer of 0 must be rendered"
+
+
+# ---------------------------------------------------------------------------
+# Test 7: scalar values in list sections still render
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("value", [5, True, 1.5])
+@pytest.mark.parametrize("key", ["narrated_explanation", "doubts_discussion"])
+def test_generate_accepts_scalar_list_sections(generator, key, value):
+    """Malformed Claude output with a scalar in a list section must not fail generation."""
+    result = generator.generate(lesson_data={key: value})
+
+    assert isinstance(result, bytes) and result
+
+
+# ---------------------------------------------------------------------------
+# Test 8: lead-paragraph text with tabs, breaks and XML metacharacters round-trips
+# ---------------------------------------------------------------------------
+
+
+def test_lead_paragraph_text_with_special_characters_round_trips(generator):
+    """A doubt's question must survive intact, with tabs and breaks kept as such."""
+    from docx import Document
+
+    question = "Is 3 < 5 & 5 > 3?\tPick one\nthen explain"
+    lesson = {"doubts_discussion": [{"question": question, "bloom_level": "L2"}]}
+    doc = Document(io.BytesIO(generator.generate(lesson_data=lesson)))
+
+    para = next(p for p in doc.paragraphs if p.text.startswith("Q1"))
+    assert para.text == "Q1 [L2]: " + question
+    assert para.runs[0].bold and not para.runs[1].bold
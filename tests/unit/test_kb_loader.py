@@ -15,6 +15,8 @@ to ensure parsing logic stays in sync with the source-of-truth documents.
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping, Sequence
+
 import pytest
 
 # ---------------------------------------------------------------------------
@@ -118,7 +120,7 @@ def test_get_bloom_distribution_grade3(kb_loader):
     """
     dist = kb_loader.get_bloom_distribution("3")
 
-    assert isinstance(dist, dict), "get_bloom_distribution must return a dict"
+    assert isinstance(dist, Mapping), "get_bloom_distribution must return a mapping"
     for level in ("L1", "L2", "L3", "L4", "L5"):
         assert level in dist, f"Distribution must include {level}"
         assert isinstance(dist[level], int), f"Count for {level} must be an integer"
@@ -148,7 +150,7 @@ def test_get_allowed_interactions_grade3(kb_loader):
     """
     allowed = kb_loader.get_allowed_interactions("3")
 
-    assert isinstance(allowed, list), "get_allowed_interactions must return a list"
+    assert isinstance(allowed, Sequence), "get_allowed_interactions must return a sequence"
     assert len(allowed) >= 12, (
         f"Grade 3 should have at least 12 allowed interaction types, got {len(allowed)}"
     )
@@ -297,13 +299,13 @@ def test_invalid_grade_uses_fallback_not_raises(kb_loader):
     assert ceiling.max_sentence_length > 0, "Fallback ceiling must have a valid max_sentence_length"
 
     dist = kb_loader.get_bloom_distribution("99")
-    assert isinstance(dist, dict) and len(dist) > 0, (
-        "Invalid grade should fall back to a valid bloom distribution dict"
+    assert isinstance(dist, Mapping) and len(dist) > 0, (
+        "Invalid grade should fall back to a valid bloom distribution mapping"
     )
 
     interactions = kb_loader.get_allowed_interactions("99")
-    assert isinstance(interactions, list) and len(interactions) > 0, (
-        "Invalid grade should fall back to a valid interactions list"
+    assert isinstance(interactions, Sequence) and len(interactions) > 0, (
+        "Invalid grade should fall back to a valid interactions sequence"
     )
 
 
@@ -344,3 +346,143 @@ def test_get_definition_returns_none_for_unknown(kb_loader):
     assert result is None, (
         f"Expected None for unknown concept, got {result!r}"
     )
+
+
+# ---------------------------------------------------------------------------
+# Test 12: on-disk cache is written once and reused by a new loader
+# ---------------------------------------------------------------------------
+
+
+def test_disk_cache_reused_across_loaders(tmp_path, monkeypatch):
+    """With kb_cache_dir set, a second loader reuses the pickled KBData.
+
+    The first load() writes exactly one cache file; a fresh loader must then
+    return identical data without re-parsing the markdown.
+    """
+    from src.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "kb_cache_dir", str(tmp_path))
+
+    first = KBLoader(kb_path=KB_PATH).load()
+    cache_files = list(tmp_path.glob("kbcache-*.pkl"))
+    assert len(cache_files) == 1, f"Expected one cache file, got {cache_files}"
+
+    second_loader = KBLoader(kb_path=KB_PATH)
+    monkeypatch.setattr(
+        second_loader,
+        "_parse_language_guidelines",
+        lambda content: pytest.fail("cache hit must not re-parse the KB"),
+    )
+    second = second_loader.load()
+
+    assert second.checksum == first.checksum
+    assert second.language_ceilings == first.language_ceilings
+    assert second.bloom_distributions == first.bloom_distributions
+
+
+# ---------------------------------------------------------------------------
+# Test 13: concurrent first loads parse the KB only once
+# ---------------------------------------------------------------------------
+
+
+def test_concurrent_load_parses_once(monkeypatch):
+    """Threads racing on a cold loader must share one parse and one KBData."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    loader = KBLoader(kb_path=KB_PATH)
+    calls = []
+    real_read_files = loader._read_files
+
+    def counting_read_files(*args):
+        calls.append(args)
+        return real_read_files(*args)
+
+    monkeypatch.setattr(loader, "_read_files", counting_read_files)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: loader.load(), range(8)))
+
+    assert len(calls) == 1, f"KB parsed {len(calls)} times, expected once"
+    assert all(r is results[0] for r in results), "All callers must get the same KBData"
+
+
+# ---------------------------------------------------------------------------
+# Test 14: get_kb_loader returns one shared loader per KB directory
+# ---------------------------------------------------------------------------
+
+
+def test_get_kb_loader_is_shared_per_path(tmp_path):
+    """Repeated calls for the same kb_path must return the same instance."""
+    first = kb_loader_mod.get_kb_loader(KB_PATH)
+
+    assert kb_loader_mod.get_kb_loader(KB_PATH) is first
+    assert kb_loader_mod.get_kb_loader(str(tmp_path)) is not first
+
+
+# ---------------------------------------------------------------------------
+# Test 15: aload() parses off the event loop and then serves the cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_aload_parses_in_thread_then_returns_cache():
+    """A cold aload() must parse in a worker thread; a warm one returns the cache."""
+    import threading
+
+    loader = KBLoader(kb_path=KB_PATH)
+    loop_thread = threading.get_ident()
+    build_threads = []
+    real_build = loader._build
+
+    def recording_build():
+        build_threads.append(threading.get_ident())
+        return real_build()
+
+    loader._build = recording_build
+
+    first = await loader.aload()
+    second = await loader.aload()
+
+    assert second is first
+    assert len(build_threads) == 1, "Warm aload() must not rebuild the KB"
+    assert build_threads[0] != loop_thread, "Cold aload() must not parse on the event loop"
+
+
+# ---------------------------------------------------------------------------
+# Test 16: a failing file watcher is logged, not raised
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_watch_returns_when_watcher_fails(monkeypatch, caplog):
+    """An error from watchfiles itself must end watch() quietly, not kill the task."""
+    if kb_loader_mod.watchfiles is None:
+        pytest.skip("watchfiles not installed")
+
+    async def failing_awatch(*args, **kwargs):
+        raise OSError("OS file watch limit reached")
+        yield  # pragma: no cover - makes this an async generator
+
+    monkeypatch.setattr(kb_loader_mod.watchfiles, "awatch", failing_awatch)
+
+    await KBLoader(kb_path=KB_PATH).watch()
+
+    assert "OS file watch limit reached" in caplog.text
+
+
+# ---------------------------------------------------------------------------
+# Test 17: a kb_path that is a regular file reports the missing KB files
+# ---------------------------------------------------------------------------
+
+
+def test_kb_path_that_is_a_file_raises_kb_load_error(tmp_path):
+    """Pointing kb_path at a file must raise KBLoadError, not NotADirectoryError."""
+    from src.exceptions import KBLoadError
+
+    not_a_dir = tmp_path / "kb_files"
+    not_a_dir.write_text("not a directory")
+
+    with pytest.raises(KBLoadError) as exc_info:
+        KBLoader(kb_path=str(not_a_dir)).load()
+
+    assert "language_guidelines.md" in exc_info.value.missing_files
@@ -0,0 +1,48 @@
+"""Unit tests for the in-process lesson cache (src/services/lesson_cache.py).
+
+Tests cover:
+1. get/put — hits return an equal but independent copy of the lesson
+2. LRU eviction — the least recently used entry is dropped at maxsize
+3. maxsize=0 — the cache stores nothing
+"""
+
+from __future__ import annotations
+
+from src.services.lesson_cache import LessonCache
+
+
+def test_get_returns_independent_copy():
+    """A hit must equal the stored lesson without sharing mutable state."""
+    cache = LessonCache(maxsize=2)
+    lesson = {"learning_objective": "Identify trees.", "quick_quiz": [{"answer": "A"}]}
+    cache.put("k", lesson)
+
+    hit = cache.get("k")
+    assert hit == lesson
+    hit["quick_quiz"][0]["answer"] = "B"
+
+    assert cache.get("k") == lesson, "Mutating a hit must not change the cached lesson"
+    assert cache.get("missing") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    """At maxsize, putting a new lesson drops the entry used longest ago."""
+    cache = LessonCache(maxsize=2)
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2})
+    cache.get("a")  # "b" is now least recently used
+    cache.put("c", {"n": 3})
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == {"n": 1}
+    assert cache.get("c") == {"n": 3}
+
+
+def test_zero_maxsize_disables_cache():
+    """With maxsize=0 nothing is stored."""
+    cache = LessonCache(maxsize=0)
+    cache.put("k", {"n": 1})
+
+    assert len(cache) == 0
+    assert cache.get("k") is None
@@ -0,0 +1,85 @@
+"""Unit tests for the FastAPI lifespan shutdown in src/main.py.
+
+Tests cover:
+1.  a watcher that fails is logged and the rest of shutdown still runs
+2.  a watcher that ignores its stop event is left running, not cancelled
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+main = pytest.importorskip("src.main")
+
+
+@pytest.fixture
+def watching(monkeypatch):
+    """Turn the KB watcher on and record which shutdown steps run."""
+    steps: list[str] = []
+
+    async def record_close_clients() -> None:
+        steps.append("close_claude_clients")
+
+    async def record_dispose() -> None:
+        steps.append("dispose_engine")
+
+    monkeypatch.setattr(main._settings, "kb_watch", True)
+    monkeypatch.setattr(main, "close_claude_clients", record_close_clients)
+    monkeypatch.setattr(main, "dispose_engine", record_dispose)
+    monkeypatch.setattr(main, "_KB_WATCH_STOP_TIMEOUT", 0.05)
+    return steps
+
+
+# ---------------------------------------------------------------------------
+# Test 1: a failing watcher does not abort shutdown
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_shutdown_survives_failed_watcher(watching, monkeypatch, caplog):
+    """An exception from the watcher task is logged; clients and engine still close."""
+
+    async def failing_watch(self, stop_event=None):
+        raise OSError("OS file watch limit reached")
+
+    monkeypatch.setattr(main.KBLoader, "watch", failing_watch)
+
+    async with main.lifespan(main.app):
+        await asyncio.sleep(0)
+
+    assert "OS file watch limit reached" in caplog.text
+    assert watching == ["close_claude_clients", "dispose_engine"]
+
+
+# ---------------------------------------------------------------------------
+# Test 2: a watcher that outlives the timeout is not cancelled
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_shutdown_does_not_cancel_slow_watcher(watching, monkeypatch):
+    """Cancelling the watcher strands its native thread, so shutdown must only wait."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+    cancelled = False
+
+    async def stubborn_watch(self, stop_event=None):
+        nonlocal cancelled
+        started.set()
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    monkeypatch.setattr(main.KBLoader, "watch", stubborn_watch)
+
+    async with main.lifespan(main.app):
+        await started.wait()
+
+    assert not cancelled, "Shutdown must not cancel the watcher task"
+    assert watching == ["close_claude_clients", "dispose_engine"]
+    release.set()
+    await asyncio.sleep(0)
@@ -2,9 +2,13 @@
 
 Tests cover:
 1. _parse_json_response — valid JSON, markdown-wrapped JSON, invalid JSON, non-dict result
-2. _assemble_prompt — confirms all required sections appear in the prompt
-3. generate_lesson — happy path with mocked Claude API
-4. _call_claude_with_retry — exhausted retries raise LessonGenerationError
+2. _assemble_prompt — confirms all required sections appear in the prompt and
+   that the static sections are cached across topics
+3. generate_lesson — happy path with mocked Claude API; KB sent as a cached
+   system block; lesson cache hits and force_refresh; batch generation
+4. _call_claude_with_retry — exhausted retries raise LessonGenerationError;
+   back-off jitter, retry-after handling, fail-fast on non-retriable errors
+   and on an open circuit breaker
 5. _call_claude — missing API key, API status error, API connection error, empty response
 
 No real Anthropic API calls are made; all network I/O is mocked via unittest.mock.
@@ -12,6 +16,7 @@ No real Anthropic API calls are made; all network I/O is mocked via unittest.moc
 
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -32,13 +37,31 @@ _SUBJECT = "EVS"
 _CHAPTER = "Types of Plants"
 
 
+@pytest.fixture(autouse=True)
+def _fresh_claude_clients():
+    """Reset the shared Claude clients, limiter, breaker and lesson cache between tests.
+
+    Each test patches ``anthropic.AsyncAnthropic`` separately, so a client
+    cached by an earlier test must not be reused.
+    """
+    from src.services import orchestrator as orchestrator_mod
+
+    orchestrator_mod._clients.clear()
+    orchestrator_mod._rate_limiter = None
+    orchestrator_mod._lesson_cache = None
+    orchestrator_mod._circuit_breaker = None
+    yield
+    orchestrator_mod._clients.clear()
+    orchestrator_mod._rate_limiter = None
+    orchestrator_mod._lesson_cache = None
+    orchestrator_mod._circuit_breaker = None
+
+
 def _make_orchestrator(api_key: str = "test_key") -> LessonGenerationOrchestrator:
     """Create an orchestrator with a real KBLoader (kb_files on disk)."""
-    from src.services.kb_loader import KBLoader
+    from src.services.kb_loader import get_kb_loader
 
-    kb_loader = KBLoader(
-        kb_path="/home/kunal/projects/kitmeK-lesson-backend/kb_files"
-    )
+    kb_loader = get_kb_loader("/home/kunal/projects/kitmeK-lesson-backend/kb_files")
     return LessonGenerationOrchestrator(
         kb_loader=kb_loader,
         anthropic_api_key=api_key,
@@ -131,14 +154,8 @@ def test_assemble_prompt_contains_topic_and_grade():
         chapter_narrative="",
         prerequisites=[],
         exclusions=[],
-        kb_data_dict={
-            "pedagogy": "",
-            "language_guidelines": "",
-            "bloom_taxonomy": "",
-            "interactions": "",
-            "question_bank": "",
-            "definitions": "",
-        },
+        raw_content={},
+        kb_checksum="test",
     )
 
     assert isinstance(prompt, str), "Prompt must be a string"
@@ -162,14 +179,8 @@ def test_assemble_prompt_includes_exclusions():
         chapter_narrative="",
         prerequisites=[],
         exclusions=["climbers", "creepers"],
-        kb_data_dict={
-            "pedagogy": "",
-            "language_guidelines": "",
-            "bloom_taxonomy": "",
-            "interactions": "",
-            "question_bank": "",
-            "definitions": "",
-        },
+        raw_content={},
+        kb_checksum="test",
     )
 
     assert "climbers" in prompt, "Exclusions must appear in the assembled prompt"
@@ -192,19 +203,76 @@ def test_assemble_prompt_includes_chapter_narrative():
         chapter_narrative=narrative,
         prerequisites=[],
         exclusions=[],
-        kb_data_dict={
-            "pedagogy": "",
-            "language_guidelines": "",
-            "bloom_taxonomy": "",
-            "interactions": "",
-            "question_bank": "",
-            "definitions": "",
-        },
+        raw_content={},
+        kb_checksum="test",
     )
 
     assert "Meera" in prompt, "Chapter narrative must be embedded in the prompt"
 
 
+def test_assemble_prompt_reuses_static_sections():
+    """Prompts for two topics of the same grade share the cached static text.
+
+    Only the lesson specification differs, so the second call must hit the
+    static-section cache and the two prompts must share the same KB head.
+    """
+    from src.services.orchestrator import _static_prompt_sections
+
+    orchestrator = _make_orchestrator()
+    raw_content = {
+        "NCERT_Pedagogical_Style_Knowledge.md": "Pedagogy text",
+        "definitions_and_examples.md": "Definitions text",
+    }
+    common = dict(
+        grade=_GRADE,
+        subject=_SUBJECT,
+        chapter_name=_CHAPTER,
+        chapter_narrative="",
+        prerequisites=[],
+        exclusions=[],
+        raw_content=raw_content,
+        kb_checksum="test",
+    )
+
+    first = orchestrator._assemble_prompt(topic_data=_TOPIC_DATA, **common)
+    hits_before = _static_prompt_sections.cache_info().hits
+    second = orchestrator._assemble_prompt(topic_data={"topic_name": "Climbers"}, **common)
+
+    assert _static_prompt_sections.cache_info().hits == hits_before + 1
+    head = first.split("**Topic:**")[0]
+    assert "Pedagogy text" in head
+    assert second.startswith(head), "Static prompt head must be identical across topics"
+    assert "Climbers" in second and "Trees vs Shrubs" not in second
+
+
+def test_assemble_prompt_keys_static_sections_on_given_checksum():
+    """The static-section cache is keyed on the caller's KB checksum.
+
+    The checksum comes from the same ``KBData`` as *raw_content* rather than
+    a second ``load()``, so a new checksum must rebuild the sections.
+    """
+    from src.services.orchestrator import _static_prompt_sections
+
+    orchestrator = _make_orchestrator()
+    common = dict(
+        topic_data=_TOPIC_DATA,
+        grade=_GRADE,
+        subject=_SUBJECT,
+        chapter_name=_CHAPTER,
+        chapter_narrative="",
+        prerequisites=[],
+        exclusions=[],
+        raw_content={},
+    )
+
+    orchestrator._assemble_prompt(kb_checksum="checksum-a", **common)
+    misses_before = _static_prompt_sections.cache_info().misses
+    orchestrator._assemble_prompt(kb_checksum="checksum-a", **common)
+    orchestrator._assemble_prompt(kb_checksum="checksum-b", **common)
+
+    assert _static_prompt_sections.cache_info().misses == misses_before + 1
+
+
 # ---------------------------------------------------------------------------
 # Test group 3: generate_lesson (mocked Claude API)
 # ---------------------------------------------------------------------------
@@ -219,7 +287,7 @@ async def test_generate_lesson_happy_path():
     """
     orchestrator = _make_orchestrator()
 
-    mock_block = MagicMock()
+    mock_block = MagicMock(type="text")
     mock_block.text = json.dumps(VALID_GRADE3_LESSON)
 
     mock_message = MagicMock()
@@ -251,7 +319,7 @@ async def test_generate_lesson_with_prerequisites_and_exclusions():
     """
     orchestrator = _make_orchestrator()
 
-    mock_block = MagicMock()
+    mock_block = MagicMock(type="text")
     mock_block.text = json.dumps({"learning_objective": "Identify plants."})
 
     mock_message = MagicMock()
@@ -282,6 +350,130 @@ async def test_generate_lesson_with_prerequisites_and_exclusions():
     assert "Living things" in captured_prompt[0], "Prerequisites must appear in the prompt"
 
 
+@pytest.mark.asyncio
+async def test_generate_lesson_sends_kb_as_cached_system_block():
+    """The KB context goes in a cache_control system block, not the user turn.
+
+    The KB text is identical across topics, so marking it for prompt caching
+    stops every lesson from re-sending it as fresh input tokens.
+    """
+    orchestrator = _make_orchestrator()
+
+    mock_block = MagicMock(type="text")
+    mock_block.text = json.dumps({"learning_objective": "Identify plants."})
+    mock_message = MagicMock()
+    mock_message.content = [mock_block]
+
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(return_value=mock_message)
+
+    with patch("anthropic.AsyncAnthropic", return_value=mock_client):
+        await orchestrator.generate_lesson(
+            topic_data=_TOPIC_DATA,
+            grade=_GRADE,
+            subject=_SUBJECT,
+            chapter_name=_CHAPTER,
+        )
+
+    kwargs = mock_client.messages.create.await_args.kwargs
+    (system_block,) = kwargs["system"]
+    user_content = kwargs["messages"][0]["content"]
+
+    assert system_block["cache_control"] == {"type": "ephemeral"}
+    assert "[KB SECTION 1: PEDAGOGICAL PRINCIPLES]" in system_block["text"]
+    assert "Trees vs Shrubs" not in system_block["text"], "Topic must stay out of the cache"
+    assert "[KB SECTION 1" not in user_content, "KB must not be repeated in the user turn"
+    assert "Trees vs Shrubs" in user_content
+
+
+@pytest.mark.asyncio
+async def test_generate_lesson_reuses_cached_lesson():
+    """An identical request is served from the lesson cache unless force_refresh.
+
+    The cached lesson must be a copy: mutating one result must not leak
+    into the next cache hit.
+    """
+    from src.services import orchestrator as orchestrator_mod
+    from src.services.lesson_cache import LessonCache
+
+    orchestrator_mod._lesson_cache = LessonCache(maxsize=4)
+    orchestrator = _make_orchestrator()
+
+    mock_block = MagicMock(type="text")
+    mock_block.text = json.dumps(VALID_GRADE3_LESSON)
+    mock_message = MagicMock()
+    mock_message.content = [mock_block]
+
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(return_value=mock_message)
+    request = dict(topic_data=_TOPIC_DATA, grade=_GRADE, subject=_SUBJECT, chapter_name=_CHAPTER)
+
+    with patch("anthropic.AsyncAnthropic", return_value=mock_client):
+        first = await orchestrator.generate_lesson(**request)
+        first["learning_objective"] = "mutated by caller"
+        second = await orchestrator.generate_lesson(**request)
+        assert mock_client.messages.create.await_count == 1, "Second call must hit the cache"
+
+        await orchestrator.generate_lesson(**request, force_refresh=True)
+        assert mock_client.messages.create.await_count == 2, "force_refresh must call Claude"
+
+    assert second == VALID_GRADE3_LESSON
+
+
+@pytest.mark.asyncio
+async def test_generate_lessons_batch_preserves_order_and_isolates_failures():
+    """Batch results come back in spec order, with failures returned in place."""
+    orchestrator = _make_orchestrator()
+    in_flight = 0
+    peak = 0
+
+    async def fake_generate_lesson(**spec):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if spec["topic_data"]["topic_name"] == "bad":
+            raise LessonGenerationError("boom")
+        return {"topic": spec["topic_data"]["topic_name"]}
+
+    names = ["a", "bad", "c", "d", "e"]
+    specs = [
+        dict(topic_data={"topic_name": n}, grade=_GRADE, subject=_SUBJECT, chapter_name=_CHAPTER)
+        for n in names
+    ]
+
+    with patch.object(orchestrator, "generate_lesson", side_effect=fake_generate_lesson):
+        results = await orchestrator.generate_lessons_batch(specs, max_concurrency=2)
+
+    assert isinstance(results[1], LessonGenerationError)
+    assert [r["topic"] for r in results if not isinstance(r, Exception)] == ["a", "c", "d", "e"]
+    assert peak == 2, f"Batch must respect max_concurrency, saw {peak} in flight"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+async def test_generate_lessons_batch_without_cap_runs_everything(max_concurrency):
+    """A max_concurrency of 0 or less means no cap, not a hang or a ValueError."""
+    orchestrator = _make_orchestrator()
+
+    async def fake_generate_lesson(**spec):
+        return {"topic": spec["topic_data"]["topic_name"]}
+
+    specs = [
+        dict(topic_data={"topic_name": n}, grade=_GRADE, subject=_SUBJECT, chapter_name=_CHAPTER)
+        for n in ["a", "b", "c"]
+    ]
+
+    with patch.object(orchestrator, "generate_lesson", side_effect=fake_generate_lesson):
+        results = await asyncio.wait_for(
+            orchestrator.generate_lessons_batch(specs, max_concurrency=max_concurrency),
+            timeout=1.0,
+        )
+
+    assert [r["topic"] for r in results] == ["a", "b", "c"]
+
+
 # ---------------------------------------------------------------------------
 # Test group 4: _call_claude_with_retry (retry exhaustion)
 # ---------------------------------------------------------------------------
@@ -317,6 +509,108 @@ async def test_call_claude_with_retry_raises_after_exhausted():
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("retry_after, base", [("7", 7.0), ("600", 30.0)])
+async def test_call_claude_with_retry_honours_retry_after(retry_after, base):
+    """A 429's retry-after replaces the back-off, capped at 30 s, plus ≤25 % jitter."""
+    import anthropic as anthropic_mod
+    orchestrator = _make_orchestrator()
+
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(
+        side_effect=anthropic_mod.APIStatusError(
+            "rate limit",
+            response=MagicMock(status_code=429, headers={"retry-after": retry_after}),
+            body=None,
+        )
+    )
+
+    with patch("anthropic.AsyncAnthropic", return_value=mock_client), \
+         patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with pytest.raises(LessonGenerationError):
+            await orchestrator._call_claude_with_retry("test prompt")
+
+    waits = [call.args[0] for call in mock_sleep.await_args_list]
+    assert len(waits) == 2
+    assert all(base <= w <= base * 1.25 for w in waits), (
+        f"retry-after must replace the back-off, got {waits}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_call_claude_with_retry_adds_jitter_to_backoff():
+    """Without retry-after, each wait is the exponential back-off plus ≤25 % jitter."""
+    import anthropic as anthropic_mod
+    orchestrator = _make_orchestrator()
+
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(
+        side_effect=anthropic_mod.APIConnectionError(request=MagicMock())
+    )
+
+    with patch("anthropic.AsyncAnthropic", return_value=mock_client), \
+         patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with pytest.raises(LessonGenerationError):
+            await orchestrator._call_claude_with_retry("test prompt")
+
+    first, second = (call.args[0] for call in mock_sleep.await_args_list)
+    assert 1.0 <= first <= 1.25
+    assert 2.0 <= second <= 2.5
+
+
+@pytest.mark.asyncio
+async def test_call_claude_with_retry_fails_fast_on_auth_error():
+    """A 401 must fail after one attempt — retrying cannot fix bad credentials."""
+    import anthropic as anthropic_mod
+    orchestrator = _make_orchestrator()
+
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(
+        side_effect=anthropic_mod.AuthenticationError(
+            "invalid x-api-key",
+            response=MagicMock(status_code=401),
+            body=None,
+        )
+    )
+
+    with patch("anthropic.AsyncAnthropic", return_value=mock_client), \
+         patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with pytest.raises(LessonGenerationError, match="not retriable") as exc_info:
+            await orchestrator._call_claude_with_retry("test prompt")
+
+    assert mock_client.messages.create.await_count == 1
+    mock_sleep.assert_not_awaited()
+    assert exc_info.value.attempt == 1
+
+
+@pytest.mark.asyncio
+async def test_call_claude_with_retry_stops_when_circuit_opens():
+    """Once upstream failures open the circuit, remaining attempts fail fast."""
+    import anthropic as anthropic_mod
+    from src.exceptions import CircuitOpenError
+    from src.services import orchestrator as orchestrator_mod
+    from src.services.circuit_breaker import CircuitBreaker
+
+    orchestrator_mod._circuit_breaker = CircuitBreaker(
+        failure_threshold=2,
+        reset_timeout=60.0,
+        is_failure=orchestrator_mod._is_upstream_failure,
+    )
+    orchestrator = _make_orchestrator()
+
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(
+        side_effect=anthropic_mod.APIConnectionError(request=MagicMock())
+    )
+
+    with patch("anthropic.AsyncAnthropic", return_value=mock_client), \
+         patch("asyncio.sleep", new_callable=AsyncMock):
+        with pytest.raises(CircuitOpenError):
+            await orchestrator._call_claude_with_retry("test prompt")
+
+    assert mock_client.messages.create.await_count == 2, "Third attempt must not reach Claude"
+
+
 # ---------------------------------------------------------------------------
 # Test group 5: _call_claude (individual call errors)
 # ---------------------------------------------------------------------------
@@ -358,6 +652,28 @@ async def test_call_claude_raises_on_empty_response():
             await orchestrator._call_claude("test prompt")
 
 
+@pytest.mark.asyncio
+async def test_call_claude_uses_first_text_block():
+    """Non-text blocks (thinking, tool_use) ahead of the text must be skipped."""
+    orchestrator = _make_orchestrator()
+
+    thinking_block = MagicMock(type="thinking")
+    thinking_block.text = "not the lesson"
+    text_block = MagicMock(type="text")
+    text_block.text = json.dumps({"learning_objective": "Identify plants."})
+
+    mock_message = MagicMock()
+    mock_message.content = [thinking_block, text_block]
+
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(return_value=mock_message)
+
+    with patch("anthropic.AsyncAnthropic", return_value=mock_client):
+        result = await orchestrator._call_claude("test prompt")
+
+    assert result == {"learning_objective": "Identify plants."}
+
+
 @pytest.mark.asyncio
 async def test_call_claude_raises_on_connection_error():
     """_call_claude raises LessonGenerationError on APIConnectionError.
@@ -376,3 +692,26 @@ async def test_call_claude_raises_on_connection_error():
     with patch("anthropic.AsyncAnthropic", return_value=mock_client):
         with pytest.raises(LessonGenerationError, match="connection error"):
             await orchestrator._call_claude("test prompt")
+
+
+@pytest.mark.asyncio
+async def test_call_claude_reuses_client_across_orchestrators():
+    """Orchestrators sharing an API key must share one AsyncAnthropic client.
+
+    Building a client per call would open a fresh connection pool (and TLS
+    handshake) for every lesson.
+    """
+    mock_block = MagicMock(type="text")
+    mock_block.text = json.dumps({"learning_objective": "Identify plants."})
+    mock_message = MagicMock()
+    mock_message.content = [mock_block]
+
+    mock_client = MagicMock()
+    mock_client.messages.create = AsyncMock(return_value=mock_message)
+
+    with patch("anthropic.AsyncAnthropic", return_value=mock_client) as factory:
+        await _make_orchestrator()._call_claude("first prompt")
+        await _make_orchestrator()._call_claude("second prompt")
+
+    assert factory.call_count == 1, "Client must be constructed once per API key"
+    assert mock_client.messages.create.await_count == 2
@@ -0,0 +1,86 @@
+"""Unit tests for the Claude rate limiter (src/services/rate_limiter.py).
+
+Tests cover:
+1. Requests-per-minute — calls beyond the limit wait for the window to slide
+2. Tokens-per-minute — a request that would exceed the token budget waits
+3. Oversized requests — a single request above the whole budget still runs
+4. Concurrency cap — no more than ``max_concurrency`` calls are in flight
+
+Windows are shortened to fractions of a second so the tests stay fast.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from src.services.rate_limiter import ClaudeRateLimiter
+
+_WINDOW = 0.2
+
+
+@pytest.mark.asyncio
+async def test_requests_beyond_rpm_wait_for_window():
+    """The third request under a 2-per-window limit must wait for the window."""
+    limiter = ClaudeRateLimiter(
+        requests_per_minute=2, tokens_per_minute=0, max_concurrency=0, window_seconds=_WINDOW
+    )
+
+    start = time.monotonic()
+    for _ in range(2):
+        async with limiter.limit(1):
+            pass
+    assert time.monotonic() - start < _WINDOW, "Requests within the limit must not wait"
+
+    async with limiter.limit(1):
+        pass
+    assert time.monotonic() - start >= _WINDOW * 0.9, "Third request must wait for the window"
+
+
+@pytest.mark.asyncio
+async def test_requests_beyond_tpm_wait_for_window():
+    """A request that would push estimated tokens over the budget must wait."""
+    limiter = ClaudeRateLimiter(
+        requests_per_minute=0, tokens_per_minute=100, max_concurrency=0, window_seconds=_WINDOW
+    )
+
+    start = time.monotonic()
+    await limiter.acquire(60)
+    limiter.release()
+    await limiter.acquire(60)
+    limiter.release()
+
+    assert time.monotonic() - start >= _WINDOW * 0.9, "Token budget overflow must wait"
+
+
+@pytest.mark.asyncio
+async def test_oversized_request_runs_when_window_empty():
+    """A request larger than the whole token budget must not block forever."""
+    limiter = ClaudeRateLimiter(
+        requests_per_minute=0, tokens_per_minute=100, max_concurrency=0, window_seconds=_WINDOW
+    )
+
+    await asyncio.wait_for(limiter.acquire(500), timeout=_WINDOW)
+    limiter.release()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_limits_in_flight_calls():
+    """No more than max_concurrency calls may hold a slot at the same time."""
+    limiter = ClaudeRateLimiter(requests_per_minute=0, tokens_per_minute=0, max_concurrency=2)
+    in_flight = 0
+    peak = 0
+
+    async def call() -> None:
+        nonlocal in_flight, peak
+        async with limiter.limit(1):
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+
+    assert peak == 2, f"Expected at most 2 concurrent calls, saw {peak}"
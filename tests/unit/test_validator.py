@@ -26,11 +26,11 @@ from src.services.validator import LessonValidator, ValidationReport as Internal
 
 from tests.fixtures.mock_kb_files import MockKBLoader
 from tests.fixtures.sample_lessons import (
-    INVALID_LESSON_BAD_INTERACTION,
-    INVALID_LESSON_LONG_SENTENCES,
-    INVALID_LESSON_MISSING_FEEDBACK,
-    INVALID_LESSON_WRONG_BLOOMS,
     VALID_GRADE3_LESSON,
+    make_invalid_bad_interaction,
+    make_invalid_long_sentences,
+    make_invalid_missing_feedback,
+    make_invalid_wrong_blooms,
 )
 
 
@@ -97,10 +97,10 @@ async def test_valid_grade3_lesson_passes_all_checks(validator):
 async def test_long_sentence_fails_language_ceiling(validator):
     """A lesson with a 25-word sentence fails the language_ceiling check.
 
-    INVALID_LESSON_LONG_SENTENCES has one sentence far exceeding Grade 3's
+    make_invalid_long_sentences() has one sentence far exceeding Grade 3's
     12-word ceiling.  The check must be marked 'failed' in the report.
     """
-    report = await _validate(validator, INVALID_LESSON_LONG_SENTENCES)
+    report = await _validate(validator, make_invalid_long_sentences())
 
     assert report.passed is False, (
         "Lesson with sentence > 12 words must fail validation"
@@ -120,11 +120,11 @@ async def test_long_sentence_fails_language_ceiling(validator):
 async def test_wrong_blooms_distribution_fails(validator):
     """A lesson with all-L1 quiz questions fails the blooms_distribution check.
 
-    INVALID_LESSON_WRONG_BLOOMS has 10 L1 questions; Grade 3 requires
+    make_invalid_wrong_blooms() has 10 L1 questions; Grade 3 requires
     L1×2, L2×3, L3×3, L4×1, L5×1.  The distribution mismatch must be
     detected and reported.
     """
-    report = await _validate(validator, INVALID_LESSON_WRONG_BLOOMS)
+    report = await _validate(validator, make_invalid_wrong_blooms())
 
     assert report.passed is False, (
         "Lesson with wrong Bloom's distribution must fail"
@@ -146,7 +146,7 @@ async def test_bad_interaction_type_fails(validator):
     'Scratch to reveal' is only allowed for Grade K (per digital_interactions.md).
     The validator must detect it is not in the Grade 3 allowed list.
     """
-    report = await _validate(validator, INVALID_LESSON_BAD_INTERACTION)
+    report = await _validate(validator, make_invalid_bad_interaction())
 
     assert report.passed is False, (
         "Lesson with disallowed interaction type must fail"
@@ -167,9 +167,9 @@ async def test_missing_quiz_feedback_fails(validator):
     """A lesson whose quiz questions lack feedback fields fails feedback_structure.
 
     Every quiz question must have both ``feedback_correct`` and
-    ``feedback_incorrect``.  INVALID_LESSON_MISSING_FEEDBACK strips them all.
+    ``feedback_incorrect``.  make_invalid_missing_feedback() strips them all.
     """
-    report = await _validate(validator, INVALID_LESSON_MISSING_FEEDBACK)
+    report = await _validate(validator, make_invalid_missing_feedback())
 
     assert report.passed is False, (
         "Lesson with missing quiz feedback must fail"
@@ -510,3 +510,235 @@ async def test_blooms_distribution_fails_when_quiz_missing(validator):
     assert blooms_check.status == "failed", (
         f"Missing quick_quiz must fail blooms_distribution, got {blooms_check.status}"
     )
+
+
+# ---------------------------------------------------------------------------
+# Test 15: checks run off the event loop thread
+# ---------------------------------------------------------------------------
+
+
+async def test_validate_runs_checks_in_worker_thread():
+    """validate() runs the CPU-bound checks in a worker thread, not on the loop."""
+    import threading
+
+    validator = LessonValidator()
+    check_threads: list[int] = []
+    original = validator.language_ceiling_check
+
+    def _recording_check(**kwargs):
+        check_threads.append(threading.get_ident())
+        return original(**kwargs)
+
+    validator.language_ceiling_check = _recording_check  # type: ignore[method-assign]
+
+    report = await _validate(validator, VALID_GRADE3_LESSON)
+
+    assert check_threads and check_threads[0] != threading.get_ident()
+    assert [c.name for c in report.checks][0] == "language_ceiling"
+    assert len(report.checks) == 8
+
+
+# ---------------------------------------------------------------------------
+# Test 16: the lesson text is extracted once per validation
+# ---------------------------------------------------------------------------
+
+
+async def test_validate_extracts_lesson_text_once(validator, monkeypatch):
+    """All text-based checks share one _extract_all_text walk per validate()."""
+    from src.services import validator as validator_module
+
+    calls: list[dict] = []
+    original = validator_module._extract_all_text
+
+    def _counting_extract(lesson_data):
+        calls.append(lesson_data)
+        return original(lesson_data)
+
+    monkeypatch.setattr(validator_module, "_extract_all_text", _counting_extract)
+
+    await validator.validate(
+        lesson_data=VALID_GRADE3_LESSON,
+        grade="3",
+        subject="EVS",
+        exclusions=["photosynthesis"],
+        kb_definitions={"shrub": "A small woody plant."},
+    )
+
+    assert len(calls) == 1
+
+
+# ---------------------------------------------------------------------------
+# Test 17: text extraction keeps document order and handles deep nesting
+# ---------------------------------------------------------------------------
+
+
+def test_extract_all_text_preserves_order_and_survives_deep_nesting():
+    """_extract_all_text joins strings in document order without recursing."""
+    from src.services.validator import _extract_all_text
+
+    lesson = {"a": "one", "b": [{"c": "two"}, "three", 4, None], "d": {"e": ["four"]}}
+    assert _extract_all_text(lesson) == "one two three four"
+
+    deep: dict = {"leaf": "bottom"}
+    for _ in range(5000):
+        deep = {"child": [deep]}
+    assert _extract_all_text(deep) == "bottom"
+
+
+# ---------------------------------------------------------------------------
+# Test 18: one scan tallies every audio marker kind
+# ---------------------------------------------------------------------------
+
+
+def test_scan_lesson_counts_each_marker_kind():
+    """_scan_lesson separates Beat, Pause and Emphasis in a single pass."""
+    from src.services.validator import _scan_lesson
+
+    scan = _scan_lesson({
+        "text": "[Beat] Look! [Pause] A [Emphasis: root] holds. [Beat] [Emphasis:stem] "
+        "[Emphasis] [Beat:] [pause]"
+    })
+
+    assert scan.beats == 2
+    assert scan.pauses == 1
+    assert scan.emphasis_words == ["root", "stem"]
+    assert scan.sentences == ["Look!", "A  holds.", "[Emphasis] [Beat:] [pause]"]
+
+
+# ---------------------------------------------------------------------------
+# Test 19: word counting ignores punctuation-only tokens
+# ---------------------------------------------------------------------------
+
+
+def test_count_words_ignores_punctuation_only_tokens():
+    """_count_words counts whitespace tokens that contain a letter or digit."""
+    from src.services.validator import _count_words
+
+    assert _count_words("Roots — hold the plant, don't they?") == 6
+    assert _count_words("... — !") == 0
+    assert _count_words("(3) trees\tand\n'shrubs'") == 4
+
+
+# ---------------------------------------------------------------------------
+# Test 20: content isolation without exclusions skips the lesson scan
+# ---------------------------------------------------------------------------
+
+
+def test_content_isolation_without_exclusions_skips_scan(validator, monkeypatch):
+    """content_isolation passes without walking the lesson when nothing is excluded."""
+    from src.services import validator as validator_module
+
+    def _fail_scan(lesson_data):
+        raise AssertionError("lesson scanned although no exclusions were given")
+
+    monkeypatch.setattr(validator_module, "_scan_lesson", _fail_scan)
+
+    result = validator.content_isolation_check(
+        lesson_data=VALID_GRADE3_LESSON, exclusions=[], prerequisites=["Plants"]
+    )
+
+    assert result.status == "passed"
+    assert result.details["excluded_found_list"] == []
+    assert result.details["prerequisites_declared"] == ["Plants"]
+
+
+# ---------------------------------------------------------------------------
+# Test 21: grade tables are read-only and never leak into report details
+# ---------------------------------------------------------------------------
+
+
+async def test_grade_tables_are_read_only(validator):
+    """The per-grade tables cannot be mutated, even through a report's details."""
+    from src.services.validator import (
+        ALLOWED_INTERACTIONS,
+        BLOOM_DISTRIBUTION,
+        LANGUAGE_CEILINGS,
+    )
+
+    with pytest.raises(TypeError):
+        LANGUAGE_CEILINGS["3"]["max_sentence_length"] = 99  # type: ignore[index]
+    with pytest.raises(TypeError):
+        BLOOM_DISTRIBUTION["3"] = {}  # type: ignore[index]
+
+    report = await _validate(validator, VALID_GRADE3_LESSON)
+    details = {c.name: c.details for c in report.checks}
+    details["blooms_distribution"]["expected"]["L1"] = 99
+    details["interaction_type"]["allowed_for_grade"].clear()
+
+    assert BLOOM_DISTRIBUTION["3"]["L1"] == 2
+    assert "Tap to Select" in ALLOWED_INTERACTIONS["3"]
+
+
+# ---------------------------------------------------------------------------
+# Test 22: compute_score uses the tallies kept by add_check
+# ---------------------------------------------------------------------------
+
+
+def test_compute_score_weights_passed_and_warning_checks():
+    """Passed checks score 1, warnings 0.5 and failures 0, averaged over all checks."""
+    from src.services.validator import CheckResult, ValidationReport as VR
+
+    report = VR()
+    for status in ("passed", "passed", "warning", "failed"):
+        report.add_check(CheckResult(name=f"check_{status}", status=status))
+    report.compute_score()
+
+    assert report.overall_score == 0.62
+    assert report.passed is False
+    assert len(report.warnings) == 1 and len(report.errors) == 1
+
+
+# ---------------------------------------------------------------------------
+# Test 23: every grade's sentence-length ceiling is enforced at the boundary
+# ---------------------------------------------------------------------------
+
+
+def test_language_ceiling_boundary_per_grade(validator, grade_ceiling):
+    """A sentence at the KB ceiling passes; one word more fails."""
+    grade, ceiling = grade_ceiling
+    max_len = ceiling["max_sentence_length"]
+
+    def lesson(words: int) -> dict:
+        return {"learning_objective": " ".join(["plant"] * words) + "."}
+
+    at_limit = validator.language_ceiling_check(lesson(max_len), grade)
+    over_limit = validator.language_ceiling_check(lesson(max_len + 1), grade)
+
+    assert at_limit.status == "passed", at_limit.message
+    assert over_limit.status == "failed"
+    assert over_limit.details["max_sentence_length"] == max_len
+
+
+# ---------------------------------------------------------------------------
+# Test 24: a quiz built from the KB distribution matches every grade's table
+# ---------------------------------------------------------------------------
+
+
+def test_blooms_distribution_matches_kb_per_grade(validator, grade_blooms):
+    """The validator's expected counts must equal the KB distribution for each grade."""
+    grade, distribution = grade_blooms
+    quiz = [{"bloom_level": level} for level, n in distribution.items() for _ in range(n)]
+
+    result = validator.blooms_distribution_check({"quick_quiz": quiz}, grade)
+
+    assert result.details["expected"] == dict(distribution)
+    assert result.details["distribution_match"] is True
+
+
+# ---------------------------------------------------------------------------
+# Test 25: every KB interaction type is accepted for its grade
+# ---------------------------------------------------------------------------
+
+
+def test_interaction_type_accepts_kb_interactions_per_grade(validator, grade_interactions):
+    """Each interaction the KB allows for a grade must pass interaction_type."""
+    grade, allowed = grade_interactions
+
+    rejected = [
+        name for name in allowed
+        if validator.interaction_type_check(
+            {"interactive_activity": {"type": name, "bloom_level": "L3"}}, grade
+        ).status != "passed"
+    ]
+
+    assert not rejected, f"Grade {grade} rejects KB interactions: {rejected}"